@@ -2,42 +2,179 @@
 
 from __future__ import annotations
 
+import re
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .config import (
     ALBUM_NAME_WORD_OVERLAP_RATIO,
     ARTIST_ALBUMS_SEARCH_LIMIT,
+    BATCH_SEARCH_LIMIT,
+    COVER_DOWNLOAD_CHUNK_SIZE,
     COVER_REQUEST_TIMEOUT,
     DEFAULT_SEARCH_LIMIT,
     EXTENDED_SEARCH_LIMIT,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_STATUSES,
     ITUNES_LARGE_IMAGE_SIZE,
     ITUNES_SMALL_IMAGE_SIZE,
+    MAX_CONCURRENT_REQUESTS,
     MAX_COVER_FILE_SIZE,
+    MUSICBRAINZ_HOST,
+    MUSICBRAINZ_REQUEST_INTERVAL,
+    USER_AGENT,
 )
 from .extractor import TrackMetadata
+from .utils.compat import DATACLASS_SLOTS
+from .utils.rate_limit import HostRateLimiter
+
+try:  # Optional fast JSON parser (pip install "youtube-to-mp3[fast]")
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if TYPE_CHECKING:
+    from .cover_cache import CoverCache
+
+
+@dataclass(frozen=True)
+class NormalizedAlbum:
+    """An expected album name, normalized once and reused across comparisons."""
+    raw: str
+    norm: str
+    words: FrozenSet[str]
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def from_name(album_name: str) -> "NormalizedAlbum":
+        """Build (or reuse) the normalized form of an album name."""
+        norm = AlbumMatcher.normalize_album_name(album_name.lower())
+        return NormalizedAlbum(raw=album_name, norm=norm, words=frozenset(norm.split()))
+
+
+# Characters with special meaning in MusicBrainz's Lucene query syntax
+_LUCENE_ESCAPE = str.maketrans({c: "\\" + c for c in '+-&|!(){}[]^"~*?:\\/'})
+
+
+@lru_cache(maxsize=1024)
+def lucene_quote(value: str) -> str:
+    """Escape and quote a value for use as a Lucene phrase term."""
+    return '"' + value.translate(_LUCENE_ESCAPE) + '"'
+
+
+# Leading part of an album name, before any parenthesized or bracketed suffix
+_ALBUM_BASE_NAME_RE = re.compile(r'[^(\[]*')
+
+# iTunes artwork: the thumbnail fields, largest first, and the size segment of
+# their URLs (e.g. ".../100x100bb.jpg"), which Apple's CDN serves at any size
+_ITUNES_ARTWORK_KEYS = (
+    f'artworkUrl{ITUNES_SMALL_IMAGE_SIZE}', 'artworkUrl60', 'artworkUrl30'
+)
+_ITUNES_ARTWORK_SIZE_RE = re.compile(r'/\d+x\d+(bb|cc)\.')
+_ITUNES_LARGE_ARTWORK_SIZE = f'/{ITUNES_LARGE_IMAGE_SIZE}x{ITUNES_LARGE_IMAGE_SIZE}bb.'
+
+# Match confidences from strongest to weakest, for batched release searches
+_BATCH_MATCH_RANKS = {'exact': 0, 'partial': 1, 'word_overlap': 2}
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter that waits for a host's rate limit before every send."""
+
+    def __init__(self, rate_limiter: HostRateLimiter, **kwargs: Any) -> None:
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        if request.url:
+            self.rate_limiter.acquire(request.url)
+        return super().send(request, *args, **kwargs)
+
+
+def create_session() -> requests.Session:
+    """Create a keep-alive session pooled for the cover lookup hosts.
+
+    Every request made through it, from any thread, respects MusicBrainz's
+    rate limit; the other hosts are not held back.
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    # MusicBrainz answers bursts with 503 and a Retry-After; back off and retry
+    # instead of treating a throttled lookup as a miss
+    retries = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    rate_limiter = HostRateLimiter(
+        0.0, intervals={MUSICBRAINZ_HOST: MUSICBRAINZ_REQUEST_INTERVAL}
+    )
+    adapter = RateLimitedAdapter(
+        rate_limiter,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class AlbumMatcher:
     """Shared utilities for album name matching and normalization."""
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_album_name(album_name: str) -> str:
         """Normalize album name for better matching."""
-        album_name = album_name.strip()
-        # Remove common suffixes that might vary
-        album_name = album_name.split('(')[0].strip()
-        album_name = album_name.split('[')[0].strip()
-        return album_name
+        # Remove common suffixes that might vary: keep text before any ( or [
+        album_name = _ALBUM_BASE_NAME_RE.match(album_name).group().strip()
+        return sys.intern(album_name)
 
     @staticmethod
-    def album_names_match(returned_album: str, expected_album: str) -> Tuple[bool, str]:
+    def album_names_match(
+        returned_album: str, expected_album: Union[str, NormalizedAlbum]
+    ) -> Tuple[bool, str]:
         """Check if album names match with confidence level."""
         if not expected_album:
             return True, "no_album_expected"
 
-        expected_norm = AlbumMatcher.normalize_album_name(expected_album.lower())
+        if isinstance(expected_album, str):
+            expected = NormalizedAlbum.from_name(expected_album)
+        else:
+            expected = expected_album
+            if not expected.raw:
+                return True, "no_album_expected"
+
+        expected_norm = expected.norm
         returned_norm = AlbumMatcher.normalize_album_name(returned_album.lower())
 
         # Exact match
@@ -48,9 +185,14 @@ class AlbumMatcher:
         if expected_norm in returned_norm or returned_norm in expected_norm:
             return True, "partial"
 
+        # A name this short is a single word at most, so any overlap would
+        # already have been caught as a partial match above
+        if len(expected_norm) < 3 or len(returned_norm) < 3:
+            return False, "no_match"
+
         # Word overlap (at least 50% of words match)
-        expected_words = set(expected_norm.split())
-        returned_words = set(returned_norm.split())
+        expected_words = expected.words
+        returned_words = frozenset(returned_norm.split())
 
         if expected_words and returned_words:
             common_words = expected_words.intersection(returned_words)
@@ -62,7 +204,7 @@ class AlbumMatcher:
         return False, "no_match"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CoverResult:
     """Result of cover retrieval."""
     success: bool
@@ -78,13 +220,16 @@ class CoverResult:
 class AlbumCoverRetriever:
     """Album cover retriever with MusicBrainz primary and iTunes fallback."""
 
-    def __init__(self):
-        self.musicbrainz = MusicBrainzRetriever()
-        self.itunes = ITunesRetriever()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'YouTubeToMP3/1.0 (https://github.com/lucasld/youtube-to-mp3)'
-        })
+    def __init__(
+        self,
+        cover_cache: Optional["CoverCache"] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        self.cover_cache = cover_cache
+        # One pooled session for every host so TCP/TLS setup is reused
+        self.session = session or create_session()
+        self.musicbrainz = MusicBrainzRetriever(self.session, cover_cache)
+        self.itunes = ITunesRetriever(self.session)
 
     def retrieve_cover(self, metadata: TrackMetadata) -> CoverResult:
         """
@@ -94,7 +239,7 @@ class AlbumCoverRetriever:
         Returns CoverResult with cover_url and optionally downloaded cover_data.
         """
         # Strategy 0: YouTube "Golden Truth" cover (highest priority)
-        if hasattr(metadata, "youtube_album_cover_url") and metadata.youtube_album_cover_url:
+        if metadata.youtube_album_cover_url:
             cover_data = self._download_cover_data(metadata.youtube_album_cover_url)
             if cover_data:
                 return CoverResult(
@@ -115,38 +260,33 @@ class AlbumCoverRetriever:
         if not metadata.album:
             return self._retrieve_cover_without_album(metadata)
 
+        if self.cover_cache:
+            cached = self.cover_cache.get(metadata.artist, metadata.album)
+            if cached:
+                return cached
+            if self.cover_cache.is_known_album_miss(metadata.artist, metadata.album):
+                return CoverResult(
+                    success=False,
+                    error="No album cover found (cached miss)",
+                    album_match_confidence="none"
+                )
+
         try:
-            # Try MusicBrainz first (primary)
-            mb_result = self.musicbrainz.retrieve_cover(metadata)
-            if mb_result.success and mb_result.cover_url:
-                # Download the cover data immediately
-                cover_data = self._download_cover_data(mb_result.cover_url)
-                if cover_data:
-                    return CoverResult(
-                        success=True,
-                        cover_url=mb_result.cover_url,
-                        cover_data=cover_data,
-                        release_info=mb_result.release_info,
-                        source="musicbrainz",
-                        album_match_confidence=mb_result.album_match_confidence
-                    )
-
-            # Fallback to iTunes
-            itunes_result = self.itunes.retrieve_cover(metadata)
-            if itunes_result.success and itunes_result.cover_url:
-                # Download the cover data immediately
-                cover_data = self._download_cover_data(itunes_result.cover_url)
-                if cover_data:
-                    return CoverResult(
-                        success=True,
-                        cover_url=itunes_result.cover_url,
-                        cover_data=cover_data,
-                        release_info=itunes_result.release_info,
-                        source="itunes",
-                        album_match_confidence=itunes_result.album_match_confidence
-                    )
+            # MusicBrainz first; iTunes is only asked once it has no usable cover
+            lookups = (
+                (self.musicbrainz.retrieve_cover, "musicbrainz"),
+                (self.itunes.retrieve_cover, "itunes"),
+            )
+            for lookup, source in lookups:
+                result = self._download_result(lookup(metadata), source)
+                if result:
+                    if self.cover_cache:
+                        self.cover_cache.set(metadata.artist, metadata.album, result)
+                    return result
 
             # No cover found from either service
+            if self.cover_cache:
+                self.cover_cache.record_album_miss(metadata.artist, metadata.album)
             return CoverResult(
                 success=False,
                 error="No album cover found from MusicBrainz or iTunes",
@@ -160,6 +300,89 @@ class AlbumCoverRetriever:
                 album_match_confidence="error"
             )
 
+    def retrieve_covers(
+        self,
+        metadatas: List[TrackMetadata],
+        on_result: Optional[Callable[[int, CoverResult], None]] = None,
+    ) -> List[CoverResult]:
+        """
+        Retrieve covers for many tracks concurrently, preserving input order.
+
+        ``on_result`` is called with each track's index and result as soon as
+        that retrieval finishes, so callers can use covers before the batch is done.
+        """
+        if not metadatas:
+            return []
+
+        results: List[CoverResult] = [CoverResult(success=False)] * len(metadatas)
+        workers = min(MAX_CONCURRENT_REQUESTS, len(metadatas))
+        try:
+            self._prefetch_recordings(metadatas)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self.retrieve_cover, metadata): index
+                    for index, metadata in enumerate(metadatas)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    results[index] = future.result()
+                    if on_result:
+                        on_result(index, results[index])
+            return results
+        finally:
+            self.clear_caches()
+
+    def _prefetch_recordings(self, metadatas: List[TrackMetadata]) -> None:
+        """Batch the MusicBrainz searches of a playlist, one query per artist.
+
+        Album-less tracks are looked up by recording, the others by release.
+        """
+        titles_by_artist: Dict[str, List[str]] = {}
+        albums_by_artist: Dict[str, List[str]] = {}
+        for metadata in metadatas:
+            if metadata.artist and metadata.album:
+                albums_by_artist.setdefault(metadata.artist, []).append(metadata.album)
+            elif metadata.artist and metadata.title:
+                titles_by_artist.setdefault(metadata.artist, []).append(metadata.title)
+
+        for artist, titles in titles_by_artist.items():
+            if len(titles) > 1:
+                self.musicbrainz.search_recordings_batch(artist, titles)
+        for artist, albums in albums_by_artist.items():
+            if len(set(albums)) > 1:
+                self.musicbrainz.search_releases_batch(artist, albums)
+
+    def clear_caches(self) -> None:
+        """Drop the per-batch search caches held by both services."""
+        self.musicbrainz.clear_cache()
+        self.itunes.clear_cache()
+
+    def close(self) -> None:
+        """Release pooled connections and the persistent cover cache."""
+        self.session.close()
+        if self.cover_cache:
+            self.cover_cache.close()
+
+    def _download_result(
+        self, lookup: CoverResult, source: str
+    ) -> Optional[CoverResult]:
+        """Download the cover referenced by a successful lookup."""
+        if not (lookup.success and lookup.cover_url):
+            return None
+
+        cover_data = self._download_cover_data(lookup.cover_url)
+        if not cover_data:
+            return None
+
+        return CoverResult(
+            success=True,
+            cover_url=lookup.cover_url,
+            cover_data=cover_data,
+            release_info=lookup.release_info,
+            source=source,
+            album_match_confidence=lookup.album_match_confidence
+        )
+
     def _retrieve_cover_without_album(self, metadata: TrackMetadata) -> CoverResult:
         """Try to retrieve cover art for singles using track metadata only."""
         if not metadata.title:
@@ -171,30 +394,14 @@ class AlbumCoverRetriever:
 
         try:
             mb_result = self.musicbrainz.retrieve_cover_for_recording(metadata)
-            if mb_result.success and mb_result.cover_url:
-                cover_data = self._download_cover_data(mb_result.cover_url)
-                if cover_data:
-                    return CoverResult(
-                        success=True,
-                        cover_url=mb_result.cover_url,
-                        cover_data=cover_data,
-                        release_info=mb_result.release_info,
-                        source="musicbrainz",
-                        album_match_confidence=mb_result.album_match_confidence
-                    )
+            result = self._download_result(mb_result, "musicbrainz")
+            if result:
+                return result
 
             itunes_result = self.itunes.retrieve_cover_for_track(metadata)
-            if itunes_result.success and itunes_result.cover_url:
-                cover_data = self._download_cover_data(itunes_result.cover_url)
-                if cover_data:
-                    return CoverResult(
-                        success=True,
-                        cover_url=itunes_result.cover_url,
-                        cover_data=cover_data,
-                        release_info=itunes_result.release_info,
-                        source="itunes",
-                        album_match_confidence=itunes_result.album_match_confidence
-                    )
+            result = self._download_result(itunes_result, "itunes")
+            if result:
+                return result
 
             return CoverResult(
                 success=False,
@@ -211,27 +418,13 @@ class AlbumCoverRetriever:
     def _download_cover_data(self, url: str) -> Optional[bytes]:
         """Download cover image data."""
         try:
-            response = self.session.get(url, timeout=COVER_REQUEST_TIMEOUT, stream=True)
-            response.raise_for_status()
-
-            # Basic validation - check if it's actually an image
-            content_type = response.headers.get('content-type', '').lower()
-            if not content_type.startswith('image/'):
-                return None
-
-            # Check content length to avoid downloading huge files
-            content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > MAX_COVER_FILE_SIZE:
-                return None
-            data = bytearray()
-            for chunk in response.iter_content(chunk_size=8192):
-                if not chunk:
-                    continue
-                data.extend(chunk)
-                if len(data) > MAX_COVER_FILE_SIZE:
-                    return None
-
-            return bytes(data)
+            # The context manager hands the connection back to the pool even
+            # when the body is abandoned part way through
+            with self.session.get(
+                url, timeout=COVER_REQUEST_TIMEOUT, stream=True
+            ) as response:
+                response.raise_for_status()
+                return self._read_cover_body(response)
         except requests.exceptions.Timeout:
             return None
         except requests.exceptions.ConnectionError:
@@ -243,6 +436,48 @@ class AlbumCoverRetriever:
         except Exception:
             return None
 
+    def _read_cover_body(self, response: requests.Response) -> Optional[bytes]:
+        """Read a streamed image body, giving up on non-images or oversize files."""
+        # Basic validation - check if it's actually an image
+        content_type = response.headers.get('content-type', '').lower()
+        if not content_type.startswith('image/'):
+            return None
+
+        # Check content length to avoid downloading huge files
+        content_length = response.headers.get('content-length')
+        if content_length and int(content_length) > MAX_COVER_FILE_SIZE:
+            return None
+
+        # With a known, unencoded length read straight into one buffer
+        if content_length and not response.headers.get('content-encoding'):
+            return self._read_exact(response, int(content_length))
+
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=COVER_DOWNLOAD_CHUNK_SIZE):
+            if not chunk:
+                continue
+            total += len(chunk)
+            if total > MAX_COVER_FILE_SIZE:
+                return None
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    @staticmethod
+    def _read_exact(response: requests.Response, length: int) -> Optional[bytes]:
+        """Read exactly ``length`` body bytes into a preallocated buffer."""
+        buffer = bytearray(length)
+        view = memoryview(buffer)
+        filled = 0
+        while filled < length:
+            read = response.raw.readinto(view[filled:])
+            if not read:
+                # Truncated body; treat like any other failed download
+                return None
+            filled += read
+        return bytes(buffer)
+
 
 # MusicBrainz implementation (adapted from improved_musicbrainz_retriever.py)
 class MusicBrainzRetriever:
@@ -251,26 +486,27 @@ class MusicBrainzRetriever:
     BASE_URL = "https://musicbrainz.org/ws/2"
     COVER_ART_URL = "https://coverartarchive.org"
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'YouTubeToMP3/1.0 (https://github.com/lucasld/youtube-to-mp3)'
-        })
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        cover_cache: Optional["CoverCache"] = None,
+    ):
+        self.session = session or create_session()
+        self.cover_cache = cover_cache
+        # Per-run lookup caches; tracks of one album share these requests
+        self._release_cache: Dict[Tuple[str, str, int], List[Dict]] = {}
+        self._cover_url_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._recording_cache: Dict[Tuple[str, str], List[Dict]] = {}
 
     def retrieve_cover(self, metadata: TrackMetadata) -> CoverResult:
         """Retrieve cover using MusicBrainz."""
         try:
-            # Strategy 1: Direct album search with validation
-            result = self._search_album_direct(metadata)
-            if result.success:
-                return result
-
-            # Strategy 2: Fuzzy album search with validation
-            result = self._search_album_fuzzy(metadata)
+            result = self._search_album(metadata)
             if result.success:
                 return result
 
-            # Strategy 3: Recording search (fallback)
+            # Strategy 3: Recording search (fallback), only once the album
+            # strategies found nothing
             result = self._search_recording(metadata)
             if result.success:
                 return result
@@ -280,97 +516,232 @@ class MusicBrainzRetriever:
         except Exception as e:
             return CoverResult(success=False, error=f"MusicBrainz error: {str(e)}")
 
-    def retrieve_cover_for_recording(self, metadata: TrackMetadata) -> CoverResult:
-        """Retrieve cover using recording search when no album is available."""
-        try:
-            result = self._search_recording(metadata)
-            if result.success:
-                return result
-            return CoverResult(success=False, error="No cover found via recording search")
-        except Exception as e:
-            return CoverResult(success=False, error=f"MusicBrainz error: {str(e)}")
+    def _search_album(self, metadata: TrackMetadata) -> CoverResult:
+        """Match one release search for the album, strictly and then broadly.
 
-    def _search_album_direct(self, metadata: TrackMetadata) -> CoverResult:
-        """Direct album search with validation."""
+        Strategy 1 takes exact title matches; strategy 2 falls back to the
+        partial and word-overlap matches from the same page, so the album
+        costs a single MusicBrainz search either way.
+        """
         if not metadata.album:
             return CoverResult(success=False)
 
         releases = self._search_releases(
-            metadata.artist, metadata.album, limit=DEFAULT_SEARCH_LIMIT
+            metadata.artist, metadata.album, limit=EXTENDED_SEARCH_LIMIT
         )
+        expected = NormalizedAlbum.from_name(metadata.album)
 
+        exact, broad = [], []
         for release in releases:
-            matches, confidence = AlbumMatcher.album_names_match(release['title'], metadata.album)
+            matches, confidence = AlbumMatcher.album_names_match(
+                release['title'], expected
+            )
             if matches:
-                cover_url = self._get_cover_url(release['id'])
-                if cover_url:
-                    return CoverResult(
-                        success=True,
-                        cover_url=cover_url,
-                        release_info={'title': release['title'], 'id': release['id']},
-                        album_match_confidence=confidence
-                    )
-
-        return CoverResult(success=False)
-
-    def _search_album_fuzzy(self, metadata: TrackMetadata) -> CoverResult:
-        """Fuzzy album search with broader matching."""
-        if not metadata.album:
-            return CoverResult(success=False)
+                (exact if confidence == "exact" else broad).append(
+                    (release, confidence)
+                )
 
-        # Try with just artist name
-        releases = self._search_releases(metadata.artist, "", limit=EXTENDED_SEARCH_LIMIT)
+        return self._first_release_with_cover(exact + broad)
 
-        for release in releases:
-            matches, confidence = AlbumMatcher.album_names_match(release['title'], metadata.album)
-            if matches and confidence in ['exact', 'partial', 'word_overlap']:
-                cover_url = self._get_cover_url(release['id'])
-                if cover_url:
-                    return CoverResult(
-                        success=True,
-                        cover_url=cover_url,
-                        release_info={'title': release['title'], 'id': release['id']},
-                        album_match_confidence=confidence
-                    )
+    def retrieve_cover_for_recording(self, metadata: TrackMetadata) -> CoverResult:
+        """Retrieve cover using recording search when no album is available."""
+        try:
+            result = self._search_recording(metadata)
+            if result.success:
+                return result
+            return CoverResult(success=False, error="No cover found via recording search")
+        except Exception as e:
+            return CoverResult(success=False, error=f"MusicBrainz error: {str(e)}")
 
-        return CoverResult(success=False)
+    def clear_cache(self) -> None:
+        """Forget memoized release, recording and cover art lookups."""
+        self._release_cache.clear()
+        self._cover_url_cache.clear()
+        self._recording_cache.clear()
 
     def _search_recording(self, metadata: TrackMetadata) -> CoverResult:
         """Search by recording (track) name."""
         try:
-            query = f'artist:"{metadata.artist}" AND recording:"{metadata.title}"'
-            params = {'query': query, 'limit': DEFAULT_SEARCH_LIMIT, 'fmt': 'json'}
+            recordings = self._recording_cache.get((metadata.artist, metadata.title))
+            if recordings is None:
+                query = (
+                    f'artist:{lucene_quote(metadata.artist)} '
+                    f'AND recording:{lucene_quote(metadata.title)}'
+                )
+                params = {'query': query, 'limit': DEFAULT_SEARCH_LIMIT, 'fmt': 'json'}
 
-            response = self.session.get(f"{self.BASE_URL}/recording", params=params)
-            response.raise_for_status()
+                response = self.session.get(
+                    f"{self.BASE_URL}/recording",
+                    params=params,
+                    timeout=COVER_REQUEST_TIMEOUT,
+                )
+                response.raise_for_status()
 
-            data = response.json()
-            recordings = data.get('recordings', [])
+                data = parse_json(response)
+                recordings = data.get('recordings', [])
 
+            candidates = []
             for recording in recordings:
                 release = recording.get('releases', [{}])[0]
                 if release and 'id' in release:
-                    cover_url = self._get_cover_url(release['id'])
-                    if cover_url:
-                        return CoverResult(
-                            success=True,
-                            cover_url=cover_url,
-                            release_info={'title': release.get('title', ''), 'id': release['id']},
-                            album_match_confidence="recording_match"
-                        )
+                    candidates.append((release, "recording_match"))
+
+            return self._first_release_with_cover(candidates)
 
         except Exception:
             pass
 
         return CoverResult(success=False)
 
+    def _first_release_with_cover(
+        self, candidates: List[Tuple[Dict, str]]
+    ) -> CoverResult:
+        """Return the first candidate release, in ranking order, that has cover art.
+
+        Candidates are probed one at a time and probing stops at the first
+        hit, so a well-ranked match costs one Cover Art Archive request.
+        """
+        for release, confidence in candidates:
+            cover_url = self._get_release_cover_url(release)
+            if cover_url:
+                return CoverResult(
+                    success=True,
+                    cover_url=cover_url,
+                    release_info={'title': release.get('title', ''), 'id': release['id']},
+                    album_match_confidence=confidence
+                )
+
+        return CoverResult(success=False)
+
+    def _get_release_cover_url(self, release: Dict) -> Optional[str]:
+        """
+        Look up cover art for one release.
+
+        Release-group artwork is tried first since every release of an album
+        shares it (and the lookup is memoized); the release itself is only
+        asked when its group has none.
+        """
+        group_id = release.get('release-group', {}).get('id')
+        if group_id:
+            cover_url = self._get_cover_url(group_id, 'release-group')
+            if cover_url:
+                return cover_url
+        return self._get_cover_url(release['id'], 'release')
+
+    def search_recordings_batch(
+        self, artist: str, titles: List[str]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Look up several recordings by one artist with a single query.
+
+        Returns the matching recordings for each input title. Titles without a
+        match are omitted so callers can fall back to a per-track search.
+        """
+        wanted: Dict[str, List[str]] = {}
+        for title in titles:
+            if title:
+                normalized = AlbumMatcher.normalize_album_name(title.lower())
+                wanted.setdefault(normalized, []).append(title)
+
+        if not artist or not wanted:
+            return {}
+
+        recording_clauses = ' OR '.join(
+            f'recording:{lucene_quote(title)}'
+            for title in dict.fromkeys(titles)
+            if title
+        )
+        query = f'artist:{lucene_quote(artist)} AND ({recording_clauses})'
+        limit = min(BATCH_SEARCH_LIMIT, len(titles) * DEFAULT_SEARCH_LIMIT)
+        params = {'query': query, 'limit': limit, 'fmt': 'json'}
+
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}/recording", params=params, timeout=COVER_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            data = parse_json(response)
+        except Exception:
+            return {}
+
+        matches: Dict[str, List[Dict]] = {}
+        for recording in data.get('recordings', []):
+            normalized = AlbumMatcher.normalize_album_name(
+                recording.get('title', '').lower()
+            )
+            for title in wanted.get(normalized, []):
+                matches.setdefault(title, []).append(recording)
+
+        for title, recordings in matches.items():
+            self._recording_cache[(artist, title)] = recordings
+
+        return matches
+
+    def search_releases_batch(
+        self, artist: str, albums: List[str]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Look up several releases by one artist with a single query.
+
+        Matching releases are stored as each album's direct search results.
+        Albums without a match are omitted so callers fall back to a
+        per-album search.
+        """
+        albums = list(dict.fromkeys(album for album in albums if album))
+        if not artist or not albums:
+            return {}
+
+        release_clauses = ' OR '.join(
+            f'release:{lucene_quote(album)}' for album in albums
+        )
+        query = f'artist:{lucene_quote(artist)} AND ({release_clauses})'
+        limit = min(BATCH_SEARCH_LIMIT, len(albums) * EXTENDED_SEARCH_LIMIT)
+        params = {'query': query, 'limit': limit, 'fmt': 'json'}
+
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}/release", params=params, timeout=COVER_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            data = parse_json(response)
+        except Exception:
+            return {}
+
+        # Each release goes to the album(s) it matches best, so a loose word
+        # overlap with one album does not pull in another album's releases
+        expected = {album: NormalizedAlbum.from_name(album) for album in albums}
+        matches: Dict[str, List[Dict]] = {}
+        for release in data.get('releases', []):
+            best_rank, best_albums = len(_BATCH_MATCH_RANKS), []
+            for album, normalized in expected.items():
+                matched, confidence = AlbumMatcher.album_names_match(
+                    release.get('title', ''), normalized
+                )
+                rank = _BATCH_MATCH_RANKS.get(confidence) if matched else None
+                if rank is None or rank > best_rank:
+                    continue
+                if rank < best_rank:
+                    best_rank, best_albums = rank, []
+                best_albums.append(album)
+            for album in best_albums:
+                matches.setdefault(album, []).append(release)
+
+        for album, releases in matches.items():
+            self._release_cache[(artist, album, EXTENDED_SEARCH_LIMIT)] = releases
+
+        return matches
+
     def _search_releases(self, artist: str, album: str, limit: int = 5) -> List[Dict]:
         """Search for releases by artist and album name."""
+        cache_key = (artist, album, limit)
+        if cache_key in self._release_cache:
+            return self._release_cache[cache_key]
+
         query_parts = []
         if artist:
-            query_parts.append(f'artist:"{artist}"')
+            query_parts.append(f'artist:{lucene_quote(artist)}')
         if album:
-            query_parts.append(f'release:"{album}"')
+            query_parts.append(f'release:{lucene_quote(album)}')
 
         if not query_parts:
             return []
@@ -379,32 +750,57 @@ class MusicBrainzRetriever:
         params = {'query': query, 'limit': limit, 'fmt': 'json'}
 
         try:
-            response = self.session.get(f"{self.BASE_URL}/release", params=params)
+            response = self.session.get(
+                f"{self.BASE_URL}/release", params=params, timeout=COVER_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            data = response.json()
-            return data.get('releases', [])
+            data = parse_json(response)
+            releases = data.get('releases', [])
         except Exception:
             return []
 
-    def _get_cover_url(self, release_id: str) -> Optional[str]:
-        """Get cover art URL for a release."""
+        self._release_cache[cache_key] = releases
+        return releases
+
+    def _get_cover_url(self, mbid: str, kind: str = 'release') -> Optional[str]:
+        """Get cover art URL for a release or release group."""
+        cache_key = (kind, mbid)
+        if cache_key in self._cover_url_cache:
+            return self._cover_url_cache[cache_key]
+
+        # Releases without artwork stay that way; skip the archive round trip
+        if self.cover_cache and self.cover_cache.is_known_miss(kind, mbid):
+            self._cover_url_cache[cache_key] = None
+            return None
+
         try:
-            response = self.session.get(f"{self.COVER_ART_URL}/release/{release_id}")
+            response = self.session.get(
+                f"{self.COVER_ART_URL}/{kind}/{mbid}", timeout=COVER_REQUEST_TIMEOUT
+            )
             if response.status_code == 404:
+                self._cover_url_cache[cache_key] = None
+                if self.cover_cache:
+                    self.cover_cache.record_miss(kind, mbid)
                 return None
             response.raise_for_status()
 
-            data = response.json()
+            data = parse_json(response)
             images = data.get('images', [])
 
+            cover_url = None
+
             # Prefer front cover
             for image in images:
                 if image.get('front'):
-                    return image['image']
+                    cover_url = image['image']
+                    break
 
             # Fallback to any image
-            if images:
-                return images[0]['image']
+            if cover_url is None and images:
+                cover_url = images[0]['image']
+
+            self._cover_url_cache[cache_key] = cover_url
+            return cover_url
 
         except Exception:
             pass
@@ -418,11 +814,9 @@ class ITunesRetriever:
 
     BASE_URL = "https://itunes.apple.com/search"
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'YouTubeToMP3/1.0 (https://github.com/lucasld/youtube-to-mp3)'
-        })
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or create_session()
+        self._album_cache: Dict[Tuple[str, str, int], List[Dict]] = {}
 
     def retrieve_cover(self, metadata: TrackMetadata) -> CoverResult:
         """Retrieve cover using iTunes."""
@@ -474,69 +868,54 @@ class ITunesRetriever:
         albums = self._search_albums(
             metadata.artist, metadata.album, limit=EXTENDED_SEARCH_LIMIT
         )
+        expected = NormalizedAlbum.from_name(metadata.album)
 
         for album in albums:
             matches, confidence = AlbumMatcher.album_names_match(
-                album['collectionName'], metadata.album
+                album['collectionName'], expected
             )
             if matches and confidence in ['exact', 'partial', 'word_overlap']:
-                return CoverResult(
-                    success=True,
-                    cover_url=self._get_best_cover_url(album),
-                    release_info={
-                        'title': album['collectionName'],
-                        'artist': album.get('artistName', ''),
-                        'year': (
-                            album.get('releaseDate', '')[:4]
-                            if album.get('releaseDate') else None
-                        )
-                    },
-                    album_match_confidence=confidence
-                )
+                return self._album_result(album, confidence)
 
         return CoverResult(success=False)
 
     def _search_artist_albums(self, metadata: TrackMetadata) -> CoverResult:
         """Search artist's albums and find best match."""
         albums = self._search_albums(metadata.artist, "", limit=ARTIST_ALBUMS_SEARCH_LIMIT)
+        expected = NormalizedAlbum.from_name(metadata.album or "")
 
         for album in albums:
             matches, confidence = AlbumMatcher.album_names_match(
-                album['collectionName'], metadata.album or ""
+                album['collectionName'], expected
             )
             if matches:
-                return CoverResult(
-                    success=True,
-                    cover_url=self._get_best_cover_url(album),
-                    release_info={
-                        'title': album['collectionName'],
-                        'artist': album.get('artistName', ''),
-                        'year': (
-                            album.get('releaseDate', '')[:4]
-                            if album.get('releaseDate') else None
-                        )
-                    },
-                    album_match_confidence=confidence
-                )
+                return self._album_result(album, confidence)
 
         # If no good match but we have albums, return the first one as artist_match_only
         if albums:
-            album = albums[0]
-            return CoverResult(
-                success=True,
-                cover_url=self._get_best_cover_url(album),
-                release_info={
-                    'title': album['collectionName'],
-                    'artist': album.get('artistName', ''),
-                    'year': album.get('releaseDate', '')[:4] if album.get('releaseDate') else None
-                },
-                album_match_confidence="artist_match_only"
-            )
+            return self._album_result(albums[0], "artist_match_only")
 
         return CoverResult(success=False)
 
+    def _album_result(self, album: Dict, confidence: str) -> CoverResult:
+        """Build the result for the chosen album, rewriting only its artwork URL."""
+        return CoverResult(
+            success=True,
+            cover_url=self._get_best_cover_url(album),
+            release_info={
+                'title': album['collectionName'],
+                'artist': album.get('artistName', ''),
+                'year': album.get('releaseDate', '')[:4] if album.get('releaseDate') else None
+            },
+            album_match_confidence=confidence
+        )
+
     def _search_albums(self, artist: str, album: str, limit: int = 10) -> List[Dict]:
         """Search for albums on iTunes."""
+        cache_key = (artist, album, limit)
+        if cache_key in self._album_cache:
+            return self._album_cache[cache_key]
+
         if album:
             term = f"{artist} {album}"
             entity = "album"
@@ -552,13 +931,22 @@ class ITunesRetriever:
         }
 
         try:
-            response = self.session.get(self.BASE_URL, params=params)
+            response = self.session.get(
+                self.BASE_URL, params=params, timeout=COVER_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            data = response.json()
-            return data.get('results', [])
+            data = parse_json(response)
+            albums = data.get('results', [])
         except Exception:
             return []
 
+        self._album_cache[cache_key] = albums
+        return albums
+
+    def clear_cache(self) -> None:
+        """Forget memoized album searches."""
+        self._album_cache.clear()
+
     def _search_tracks(self, artist: str, title: str) -> List[Dict]:
         """Search for tracks on iTunes."""
         term = f"{artist} {title}".strip()
@@ -570,9 +958,11 @@ class ITunesRetriever:
         }
 
         try:
-            response = self.session.get(self.BASE_URL, params=params)
+            response = self.session.get(
+                self.BASE_URL, params=params, timeout=COVER_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             return data.get('results', [])
         except Exception:
             return []
@@ -580,13 +970,15 @@ class ITunesRetriever:
     def _get_best_cover_url(self, album: Dict) -> str:
         """Get the best cover URL from album data."""
         # iTunes provides small images by default, try to get larger versions
-        artwork_url = album.get(f'artworkUrl{ITUNES_SMALL_IMAGE_SIZE}', '')
+        artwork_url = next(
+            (album[key] for key in _ITUNES_ARTWORK_KEYS if album.get(key)), ''
+        )
         if artwork_url:
             # Try to get larger version
-            old_size = f'{ITUNES_SMALL_IMAGE_SIZE}x{ITUNES_SMALL_IMAGE_SIZE}'
-            new_size = f'{ITUNES_LARGE_IMAGE_SIZE}x{ITUNES_LARGE_IMAGE_SIZE}'
-            artwork_url = artwork_url.replace(old_size, new_size)
+            artwork_url = _ITUNES_ARTWORK_SIZE_RE.sub(
+                _ITUNES_LARGE_ARTWORK_SIZE, artwork_url, count=1
+            )
         return artwork_url
 
 
-__all__ = ["AlbumCoverRetriever", "CoverResult", "AlbumMatcher"]
+__all__ = ["AlbumCoverRetriever", "CoverResult", "AlbumMatcher", "NormalizedAlbum"]
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Callable, List, Optional
 
 from textual.app import App, ComposeResult
-from textual.screen import Screen
 from textual.widgets import Footer, Header
 
 from .config import AppConfig, load_config
@@ -57,6 +56,9 @@ class YouTubeToMp3App(App):
         self._url_screen = URLInputScreen()
         await self.push_screen(self._url_screen)
 
+    def on_unmount(self) -> None:
+        self.pipeline.close()
+
     async def start_metadata_flow(self, url: str) -> None:
         """Extract metadata for the provided URL and show the review screen."""
         try:
@@ -119,10 +121,17 @@ class YouTubeToMp3App(App):
 
     async def reset_to_input(self) -> None:
         """Return to the initial URL input screen."""
-        # Clear the entire screen stack and create a fresh URL input screen
-        self.screen_stack.clear()
-        self._url_screen = URLInputScreen()
-        await self.push_screen(self._url_screen)
+        # Unwind back to the existing URL input screen instead of rebuilding it
+        url_screen = self._url_screen
+        if url_screen is None or url_screen not in self.screen_stack:
+            url_screen = self._url_screen = URLInputScreen()
+            await self.push_screen(url_screen)
+        else:
+            # Popped screens are removed in the background; the calling screen
+            # is among them, so awaiting its removal here would deadlock.
+            while self.screen is not url_screen:
+                self.pop_screen()
+            url_screen.reset()
         self._current_extraction = None
         self._last_output_directory = None
 
@@ -135,8 +144,5 @@ class YouTubeToMp3App(App):
         """Ensure the output directory exists."""
         self.config.ensure_output_directory()
 
-    async def on_screen_dismissed(self, event: Screen.Dismissed) -> None:
-        await super().on_screen_dismissed(event)
-
 
 __all__ = ["YouTubeToMp3App"]
@@ -21,7 +21,7 @@ def _load_app_config(
     if output_dir:
         overrides["output_directory"] = output_dir
 
-    explicit = Path(config_path).expanduser() if config_path else None
+    explicit = Path(config_path) if config_path else None
     return load_config(explicit_path=explicit, overrides=overrides)
 
 
@@ -40,13 +40,40 @@ def _console_progress(index: int, total: int, job) -> None:
 
 
 def _run_non_interactive(url: str, config: AppConfig) -> None:
+    """Run a headless download to completion.
+
+    Code that already runs an event loop must ``await _run_async(...)``
+    instead; nesting a second loop is refused with a RuntimeError.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_run_async(url, config))
+        return
+    raise RuntimeError(
+        "_run_non_interactive() cannot run inside an event loop; "
+        "await _run_async(url, config) instead."
+    )
+
+
+async def _run_async(url: str, config: AppConfig) -> None:
+    """Run a headless download on the caller's event loop."""
     if not URLValidator.is_valid_youtube_url(url):
         raise click.BadParameter(
             "Please provide a valid YouTube video or playlist URL."
         )
 
     pipeline = DownloadPipeline(config)
-    extraction = pipeline.extract(url)
+    try:
+        await _download_with_pipeline(pipeline, url, config)
+    finally:
+        pipeline.close()
+
+
+async def _download_with_pipeline(
+    pipeline: DownloadPipeline, url: str, config: AppConfig
+) -> None:
+    extraction = await asyncio.to_thread(pipeline.extract, url)
 
     _print_extraction_summary(extraction, config)
 
@@ -61,13 +88,15 @@ def _run_non_interactive(url: str, config: AppConfig) -> None:
         click.echo("No tracks selected for download; exiting.")
         return
 
-    outcomes = asyncio.run(pipeline.download(jobs, progress_callback=_console_progress))
+    outcomes = await pipeline.download(jobs, progress_callback=_console_progress)
 
-    success = [outcome for outcome in outcomes if outcome.success]
+    # Only the failures are listed, so the successes just need counting
     failures = [outcome for outcome in outcomes if not outcome.success]
 
     click.echo("")
-    click.echo(f"Completed {len(success)} of {len(outcomes)} downloads.")
+    click.echo(
+        f"Completed {len(outcomes) - len(failures)} of {len(outcomes)} downloads."
+    )
 
     if failures:
         click.echo("Failures:")
@@ -4,25 +4,60 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
+from .utils.compat import DATACLASS_SLOTS
 from .utils.filesystem import get_music_directory, ensure_directory
 
 _DEFAULT_CONFIG_PATH = Path("~/.config/youtube-to-mp3/config.json").expanduser()
+COVER_CACHE_DIRECTORY = Path("~/.cache/youtube-to-mp3/covers").expanduser()
 
 # Constants for album cover retrieval and other operations
 MAX_COVER_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit for cover images
 COVER_REQUEST_TIMEOUT = 10  # seconds
+COVER_DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes per read when streaming covers
 ALBUM_NAME_WORD_OVERLAP_RATIO = 0.5  # Minimum word overlap for album matching
 DEFAULT_SEARCH_LIMIT = 5
 EXTENDED_SEARCH_LIMIT = 10
 ARTIST_ALBUMS_SEARCH_LIMIT = 20
+BATCH_SEARCH_LIMIT = 100  # MusicBrainz maximum page size
 ITUNES_SMALL_IMAGE_SIZE = 100
 ITUNES_LARGE_IMAGE_SIZE = 600
-
-
-@dataclass
+MAX_CONCURRENT_REQUESTS = 8  # Parallel cover lookups across a playlist
+# Distinct hosts kept alive: MusicBrainz, CAA and its archive.org redirects,
+# iTunes and its artwork CDN, YouTube thumbnails
+HTTP_POOL_CONNECTIONS = 8
+# Connections per host, with headroom over one per concurrent cover lookup
+HTTP_POOL_MAXSIZE = 4 * MAX_CONCURRENT_REQUESTS
+# Retries for throttled or failing lookups; Retry-After headers are honored
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3  # seconds, doubled on each retry
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# MusicBrainz allows about one request per second per client; other cover
+# hosts are not spaced out
+MUSICBRAINZ_HOST = "musicbrainz.org"
+MUSICBRAINZ_REQUEST_INTERVAL = 1.0  # seconds between MusicBrainz requests
+PLAYLIST_EXTRACT_WORKERS = 4  # Playlist entries resolved in parallel
+EXTRACT_CACHE_SIZE = 64  # URLs whose extracted metadata is kept in memory
+EXTRACT_CACHE_TTL = 10 * 60  # seconds to reuse extracted metadata for a URL
+STRUCTURED_CACHE_SIZE = 256  # videos whose "Music in this video" card is kept
+STRUCTURED_CACHE_TTL = 60 * 60  # seconds to reuse a video's parsed card
+COVER_CACHE_TTL = 30 * 24 * 60 * 60  # seconds to reuse a cached cover
+NEGATIVE_CACHE_TTL = 7 * 24 * 60 * 60  # seconds to remember a cover miss
+SESSION_COVER_TTL = 24 * 60 * 60  # seconds a running app reuses a looked-up cover
+SESSION_MISS_TTL = 10 * 60  # seconds a running app remembers a failed cover lookup
+USER_AGENT = "YouTubeToMP3/1.0 (https://github.com/lucasld/youtube-to-mp3)"
+
+
+def _expand_path(value: Union[str, Path]) -> Path:
+    """Build a path, only resolving the home directory when it is referenced."""
+    path = Path(value)
+    return path.expanduser() if str(value).startswith("~") else path
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AppConfig:
     """Application configuration with sensible defaults."""
 
@@ -31,9 +66,13 @@ class AppConfig:
     )
     audio_quality: str = "192"
     rate_limit_delay: float = 1.5
+    download_workers: int = 3
     auto_confirm_correct_metadata: bool = False
     default_genre: str = "Unknown"
     filename_template: str = "{artist} - {title}"
+    cover_cache_enabled: bool = True
+    cover_cache_directory: Path = COVER_CACHE_DIRECTORY
+    skip_tagged_watch_pages: bool = False
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
@@ -41,12 +80,15 @@ class AppConfig:
         config = cls()
 
         if "output_directory" in data and data["output_directory"]:
-            config.output_directory = Path(data["output_directory"]).expanduser()
+            config.output_directory = _expand_path(data["output_directory"])
 
         config.audio_quality = data.get("audio_quality", config.audio_quality)
         config.rate_limit_delay = float(
             data.get("rate_limit_delay", config.rate_limit_delay)
         )
+        config.download_workers = max(
+            1, int(data.get("download_workers", config.download_workers))
+        )
         config.auto_confirm_correct_metadata = bool(
             data.get(
                 "auto_confirm_correct_metadata", config.auto_confirm_correct_metadata
@@ -56,17 +98,28 @@ class AppConfig:
         config.filename_template = data.get(
             "filename_template", config.filename_template
         )
+        config.cover_cache_enabled = bool(
+            data.get("cover_cache_enabled", config.cover_cache_enabled)
+        )
+        if "cover_cache_directory" in data and data["cover_cache_directory"]:
+            config.cover_cache_directory = _expand_path(data["cover_cache_directory"])
+        config.skip_tagged_watch_pages = bool(
+            data.get("skip_tagged_watch_pages", config.skip_tagged_watch_pages)
+        )
 
         return config
 
     def merge_overrides(self, overrides: Dict[str, Any]) -> None:
         """Merge CLI or runtime overrides into this config."""
         if "output_directory" in overrides and overrides["output_directory"]:
-            self.output_directory = Path(overrides["output_directory"]).expanduser()
+            self.output_directory = _expand_path(overrides["output_directory"])
 
         if "rate_limit_delay" in overrides and overrides["rate_limit_delay"]:
             self.rate_limit_delay = float(overrides["rate_limit_delay"])
 
+        if "download_workers" in overrides and overrides["download_workers"]:
+            self.download_workers = max(1, int(overrides["download_workers"]))
+
         if "audio_quality" in overrides and overrides["audio_quality"]:
             self.audio_quality = str(overrides["audio_quality"])
 
@@ -76,6 +129,16 @@ class AppConfig:
         if "default_genre" in overrides and overrides["default_genre"]:
             self.default_genre = str(overrides["default_genre"])
 
+        if "cover_cache_enabled" in overrides:
+            self.cover_cache_enabled = bool(overrides["cover_cache_enabled"])
+
+        cover_cache_directory = overrides.get("cover_cache_directory")
+        if cover_cache_directory:
+            self.cover_cache_directory = _expand_path(cover_cache_directory)
+
+        if "skip_tagged_watch_pages" in overrides:
+            self.skip_tagged_watch_pages = bool(overrides["skip_tagged_watch_pages"])
+
     def ensure_output_directory(self) -> Path:
         """Ensure the output directory exists and return it."""
         ensure_directory(self.output_directory)
@@ -84,11 +147,20 @@ class AppConfig:
 
 def _load_config_file(path: Path) -> Dict[str, Any]:
     """Load configuration data from a JSON file."""
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         return {}
 
+    # Hand out a copy so callers never mutate the memoized data
+    return dict(_load_config_file_cached(str(path), mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _load_config_file_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; memoized until the file's mtime changes."""
     try:
-        with path.open("r", encoding="utf-8") as config_file:
+        with open(path, "r", encoding="utf-8") as config_file:
             data = json.load(config_file)
             if isinstance(data, dict):
                 return data
@@ -103,7 +175,7 @@ def load_config(
     explicit_path: Optional[Path] = None, overrides: Optional[Dict[str, Any]] = None
 ) -> AppConfig:
     """Load application configuration from disk and apply overrides."""
-    config_path = explicit_path.expanduser() if explicit_path else _DEFAULT_CONFIG_PATH
+    config_path = _expand_path(explicit_path) if explicit_path else _DEFAULT_CONFIG_PATH
     raw_data = _load_config_file(config_path)
 
     config = AppConfig.from_dict(raw_data)
@@ -0,0 +1,224 @@
+"""Persistent on-disk cache for album cover lookups."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .album_cover_retriever import AlbumMatcher, CoverResult
+from .config import COVER_CACHE_DIRECTORY, COVER_CACHE_TTL, NEGATIVE_CACHE_TTL
+
+_COLUMNS = "cover_url, source, confidence, release_info"
+
+
+class CoverCache:
+    """Cache cover lookups across runs, keyed on normalized (artist, album).
+
+    Only the exact normalized album is served; the normalization already
+    folds "(Deluxe)"-style suffixes, and looser matches would hand one
+    album's cover to another (e.g. "Greatest Hits Vol. 2" to "Greatest Hits").
+    Lookup results live in a small SQLite database and the image bytes are
+    stored next to it, one file per cover URL. Expired rows and the images
+    only they referenced are pruned when the database is first opened.
+    """
+
+    def __init__(
+        self, cache_dir: Path = COVER_CACHE_DIRECTORY, ttl: float = COVER_CACHE_TTL
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._images_dir = cache_dir / "images"
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(artist: str, album: str) -> Tuple[str, str]:
+        """Return the normalized cache key for an artist/album pair."""
+        return (
+            AlbumMatcher.normalize_album_name(artist.lower()),
+            AlbumMatcher.normalize_album_name(album.lower()),
+        )
+
+    def get(self, artist: str, album: str) -> Optional[CoverResult]:
+        """Return a cached cover for this album, or None on a miss."""
+        artist_key, album_key = self.make_key(artist, album)
+
+        # Covers older than the TTL are refetched in case better art appeared
+        fresh_since = time.time() - self.ttl
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    f"SELECT {_COLUMNS} FROM covers "
+                    "WHERE artist = ? AND album = ? AND updated_at >= ?",
+                    (artist_key, album_key, fresh_since),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        cover_url, source, confidence, release_info = row
+        cover_data = self._read_image(cover_url)
+        if cover_data is None:
+            return None
+
+        return CoverResult(
+            success=True,
+            cover_url=cover_url,
+            cover_data=cover_data,
+            release_info=json.loads(release_info) if release_info else None,
+            source=source,
+            album_match_confidence=confidence,
+        )
+
+    def set(self, artist: str, album: str, cover_result: CoverResult) -> None:
+        """Persist a successful cover lookup; failures are ignored."""
+        if not (
+            cover_result.success and cover_result.cover_url and cover_result.cover_data
+        ):
+            return
+
+        artist_key, album_key = self.make_key(artist, album)
+
+        try:
+            with self._lock:
+                # Open (and prune) first so the new image is never swept away
+                connection = self._connect()
+                self._write_image(cover_result.cover_url, cover_result.cover_data)
+                connection.execute(
+                    "INSERT OR REPLACE INTO covers "
+                    "(artist, album, cover_url, source, confidence, release_info, "
+                    "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        artist_key,
+                        album_key,
+                        cover_result.cover_url,
+                        cover_result.source,
+                        cover_result.album_match_confidence,
+                        json.dumps(cover_result.release_info)
+                        if cover_result.release_info
+                        else None,
+                        time.time(),
+                    ),
+                )
+                connection.execute(
+                    "DELETE FROM misses WHERE namespace = 'album' AND key = ?",
+                    ("|".join((artist_key, album_key)),),
+                )
+                connection.commit()
+        except (OSError, sqlite3.Error, TypeError, ValueError):
+            # The cache is best effort; a failed write only costs a refetch.
+            pass
+
+    def is_known_miss(self, namespace: str, key: str) -> bool:
+        """Return True if a lookup for ``key`` recently found nothing."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT created_at FROM misses WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None and time.time() - row[0] < NEGATIVE_CACHE_TTL
+
+    def record_miss(self, namespace: str, key: str) -> None:
+        """Remember that a lookup for ``key`` found nothing."""
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO misses (namespace, key, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (namespace, key, time.time()),
+                )
+                connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def is_known_album_miss(self, artist: str, album: str) -> bool:
+        """Return True if no cover was found for this album recently."""
+        return self.is_known_miss("album", "|".join(self.make_key(artist, album)))
+
+    def record_album_miss(self, artist: str, album: str) -> None:
+        """Remember that no service had a cover for this album."""
+        self.record_miss("album", "|".join(self.make_key(artist, album)))
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use so construction never touches disk."""
+        if self._connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.cache_dir / "covers.sqlite3"), check_same_thread=False
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS covers ("
+                "artist TEXT NOT NULL, album TEXT NOT NULL, cover_url TEXT NOT NULL, "
+                "source TEXT, confidence TEXT, release_info TEXT, "
+                "updated_at REAL NOT NULL, PRIMARY KEY (artist, album))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS misses ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "created_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            self._prune(connection)
+            self._connection = connection
+        return self._connection
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        """Drop expired rows, then every image no remaining row points at."""
+        now = time.time()
+        connection.execute("DELETE FROM covers WHERE updated_at < ?", (now - self.ttl,))
+        connection.execute(
+            "DELETE FROM misses WHERE created_at < ?", (now - NEGATIVE_CACHE_TTL,)
+        )
+        connection.commit()
+
+        if not self._images_dir.is_dir():
+            return
+        live = {
+            self._image_path(url).name
+            for (url,) in connection.execute("SELECT DISTINCT cover_url FROM covers")
+        }
+        for path in self._images_dir.iterdir():
+            if path.name not in live:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _image_path(self, url: str) -> Path:
+        return self._images_dir / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _read_image(self, url: str) -> Optional[bytes]:
+        try:
+            return self._image_path(url).read_bytes()
+        except OSError:
+            return None
+
+    def _write_image(self, url: str, data: bytes) -> None:
+        path = self._image_path(url)
+        if path.exists():
+            return
+        self._images_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(path)
+
+
+__all__ = ["CoverCache"]
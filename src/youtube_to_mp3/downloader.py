@@ -3,29 +3,83 @@
 from __future__ import annotations
 
 import logging
-import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from string import Formatter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
-import yt_dlp
 from mutagen.id3 import ID3, TALB, TCON, TIT2, TPE1, TRCK, TYER, APIC
 from mutagen.mp3 import MP3
 
 from .extractor import TrackMetadata
 from .album_cover_retriever import AlbumCoverRetriever, CoverResult
+from .utils.compat import DATACLASS_SLOTS
 from .utils.filesystem import sanitize_filename
+from .utils.rate_limit import HostRateLimiter
+from .utils.ydl import ThreadLocalYoutubeDL
 
 if TYPE_CHECKING:
+    from .cover_cache import CoverCache
     from .pipeline import AlbumCoverCache
 
 logger = logging.getLogger(__name__)
 
 
+# Leading magic bytes of the cover image formats we may embed
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+class _SafeDict(dict):
+    """Template mapping that renders unknown placeholders as empty strings."""
+
+    def __missing__(self, key: str) -> str:  # pragma: no cover - defensive
+        return ""
+
+
+# Placeholder values available to the filename template
+_FILENAME_FIELDS: Dict[str, Callable[[TrackMetadata], str]] = {
+    "artist": lambda metadata: metadata.artist or "Unknown Artist",
+    "title": lambda metadata: metadata.title or "Unknown Title",
+    "album": lambda metadata: metadata.album or "",
+    "year": lambda metadata: str(metadata.year) if metadata.year else "",
+    "track_number": lambda metadata: (
+        str(metadata.track_number) if metadata.track_number else ""
+    ),
+    "total_tracks": lambda metadata: (
+        str(metadata.total_tracks) if metadata.total_tracks else ""
+    ),
+}
+
+
+@lru_cache(maxsize=32)
+def _template_fields(
+    template: str,
+) -> Tuple[Tuple[str, Callable[[TrackMetadata], str]], ...]:
+    """Return the known placeholders a filename template actually uses."""
+    try:
+        names = {
+            field_name.split(".", 1)[0].split("[", 1)[0]
+            for _, field_name, _, _ in Formatter().parse(template)
+            if field_name
+        }
+    except ValueError:
+        # Malformed template; render everything and let format_map report it
+        names = set(_FILENAME_FIELDS)
+    return tuple(
+        (name, render) for name, render in _FILENAME_FIELDS.items() if name in names
+    )
+
+
 ProgressCallback = Callable[[int, int, "DownloadJob"], None]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DownloadResult:
     """Result of a single download operation."""
     success: bool
@@ -33,7 +87,7 @@ class DownloadResult:
     cover_result: Optional[CoverResult] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DownloadJob:
     """Represents a single download job."""
 
@@ -52,12 +106,16 @@ class AudioDownloader:
         rate_limit_delay: float = 1.5,
         audio_quality: str = "192",
         filename_template: str = "{artist} - {title}",
+        cover_cache: Optional["CoverCache"] = None,
     ):
         self.rate_limit_delay = rate_limit_delay
         self.audio_quality = audio_quality
         self.filename_template = filename_template
-        self._last_request_time = 0.0
-        self.cover_retriever = AlbumCoverRetriever()
+        self.rate_limiter = HostRateLimiter(rate_limit_delay)
+        self.cover_retriever = AlbumCoverRetriever(cover_cache=cover_cache)
+        self._ydl = ThreadLocalYoutubeDL(self._base_ydl_opts())
+        # Output folders already created; tracks of a playlist share one
+        self._created_dirs: Set[Path] = set()
 
     def download_track(self, job: DownloadJob) -> DownloadResult:
         """Download and convert a single track."""
@@ -68,16 +126,25 @@ class AudioDownloader:
     ) -> DownloadResult:
         """Download and convert a single track with optional cover cache."""
         try:
-            self._apply_rate_limit()
+            # Space out requests per host to avoid YouTube bot detection
+            self.rate_limiter.acquire(job.url)
 
-            job.output_path.parent.mkdir(parents=True, exist_ok=True)
-            ydl_opts = self._get_ydl_opts(job.output_path)
+            self._ensure_output_dir(job.output_path.parent)
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([job.url])
+            # Reuse this worker's YoutubeDL; only the per-track params change
+            ydl = self._ydl.get()
+            job_params = self._job_ydl_params(job.output_path, job.metadata)
+            ydl.params["outtmpl"]["default"] = job_params["outtmpl"]
+            ydl.params["postprocessor_args"] = job_params["postprocessor_args"]
+            info = ydl.extract_info(job.url, download=True) or {}
 
+            # An MP3 source is only remuxed, or left untouched when it already
+            # has the .mp3 extension, so ffmpeg may not have written the tags
             cover_result = self._embed_metadata_with_cache(
-                job.output_path, job.metadata, cover_cache
+                job.output_path,
+                job.metadata,
+                cover_cache,
+                write_text_tags=info.get("acodec") == "mp3",
             )
 
             job.status = "completed"
@@ -89,10 +156,29 @@ class AudioDownloader:
             job.error = str(exc)
             return DownloadResult(success=False, error=str(exc))
 
-    def _get_ydl_opts(self, output_path: Path) -> Dict[str, Any]:
+    def _ensure_output_dir(self, directory: Path) -> None:
+        """Create ``directory`` unless this downloader already did."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def close(self) -> None:
+        """Release network resources held by yt-dlp and the cover retriever."""
+        self._ydl.close()
+        self.cover_retriever.close()
+
+    def _get_ydl_opts(
+        self, output_path: Path, metadata: Optional[TrackMetadata] = None
+    ) -> Dict[str, Any]:
         """Get yt-dlp options for audio conversion."""
+        opts = self._base_ydl_opts()
+        opts.update(self._job_ydl_params(output_path, metadata))
+        return opts
+
+    def _base_ydl_opts(self) -> Dict[str, Any]:
+        """Get the yt-dlp options shared by every track."""
         return {
-            "format": "bestaudio/best",
+            "format": self._format_selector(),
             "postprocessors": [
                 {
                     "key": "FFmpegExtractAudio",
@@ -100,25 +186,80 @@ class AudioDownloader:
                     "preferredquality": self.audio_quality,
                 }
             ],
-            "outtmpl": str(output_path.with_suffix("").with_suffix(".%(ext)s")),
             "quiet": True,
             "no_warnings": True,
             "noplaylist": True,
             "overwrites": True,
         }
 
+    def _format_selector(self) -> str:
+        """Prefer an MP3 stream that already meets the target bitrate.
+
+        FFmpegExtractAudio copies an MP3 stream instead of re-encoding it,
+        which is both faster and lossless.
+        """
+        quality = str(self.audio_quality)
+        # Qualities 0-10 are VBR levels, anything larger is a bitrate in kbps
+        if quality.isdigit() and int(quality) > 10:
+            return f"bestaudio[acodec=mp3][abr>={quality}]/bestaudio/best"
+        return "bestaudio/best"
+
+    def _job_ydl_params(
+        self, output_path: Path, metadata: Optional[TrackMetadata]
+    ) -> Dict[str, Any]:
+        """Get the yt-dlp options specific to one track."""
+        postprocessor_args: Dict[str, List[str]] = {}
+        if metadata is not None:
+            # Write the text tags in the same ffmpeg pass that encodes the MP3
+            postprocessor_args["extractaudio+ffmpeg_o"] = self._ffmpeg_metadata_args(
+                metadata
+            )
+        return {
+            "outtmpl": str(output_path.with_suffix("").with_suffix(".%(ext)s")),
+            "postprocessor_args": postprocessor_args,
+        }
+
+    @staticmethod
+    def _ffmpeg_metadata_args(metadata: TrackMetadata) -> List[str]:
+        """Build ffmpeg ``-metadata`` arguments for the track's ID3 text tags."""
+        tags = {"title": metadata.title, "artist": metadata.artist}
+        if metadata.album:
+            tags["album"] = metadata.album
+        if metadata.genre:
+            tags["genre"] = metadata.genre
+        if metadata.year:
+            tags["date"] = str(metadata.year)
+        if metadata.track_number and metadata.total_tracks:
+            tags["track"] = f"{metadata.track_number}/{metadata.total_tracks}"
+
+        args: List[str] = []
+        for key, value in tags.items():
+            args += ["-metadata", f"{key}={value}"]
+        return args
+
     def _embed_metadata(self, mp3_path: Path, metadata: TrackMetadata) -> Optional[CoverResult]:
-        """Embed metadata and album cover into MP3 file. Returns cover result."""
+        """Embed the album cover into an MP3 file. Returns cover result."""
         return self._embed_metadata_with_cache(mp3_path, metadata, None)
 
     def _embed_metadata_with_cache(
         self,
         mp3_path: Path,
         metadata: TrackMetadata,
-        cover_cache: Optional["AlbumCoverCache"]
+        cover_cache: Optional["AlbumCoverCache"],
+        write_text_tags: bool = False,
     ) -> Optional[CoverResult]:
-        """Embed metadata and album cover into MP3 file with optional cache."""
-        cover_result = None
+        """Embed the album cover into an MP3 file with optional cache.
+
+        Text tags are normally written by ffmpeg during conversion, so the file
+        is only reopened when there is a cover to add or ``write_text_tags`` is
+        set because the conversion step was skipped.
+        """
+        cover_result = self._lookup_cover(metadata, cover_cache)
+        has_cover = bool(cover_result.success and cover_result.cover_data)
+        if not has_cover:
+            logger.info(f"No album cover found for '{metadata.album}'")
+            if not write_text_tags:
+                return cover_result
 
         try:
             audio = MP3(mp3_path, ID3=ID3)
@@ -126,23 +267,10 @@ class AudioDownloader:
             if audio.tags is None:
                 audio.add_tags()
 
-            # Embed basic metadata
-            audio.tags.add(TIT2(text=metadata.title))
-            audio.tags.add(TPE1(text=metadata.artist))
-
-            if metadata.album:
-                audio.tags.add(TALB(text=metadata.album))
-            if metadata.genre:
-                audio.tags.add(TCON(text=metadata.genre))
-            if metadata.year:
-                audio.tags.add(TYER(text=str(metadata.year)))
-            if metadata.track_number and metadata.total_tracks:
-                track_info = f"{metadata.track_number}/{metadata.total_tracks}"
-                audio.tags.add(TRCK(text=track_info))
-
-            # Retrieve and embed album cover
-            cover_result = self._embed_album_cover_with_cache(audio, metadata, cover_cache)
-
+            if write_text_tags:
+                self._add_text_frames(audio, metadata)
+            if has_cover:
+                self._add_cover_frame(audio, cover_result)
             audio.save()
 
         except Exception as exc:  # pragma: no cover - best effort tagging
@@ -161,108 +289,110 @@ class AudioDownloader:
         cover_cache: Optional["AlbumCoverCache"]
     ) -> CoverResult:
         """Retrieve and embed album cover into MP3 file with optional cache."""
+        cover_result = self._lookup_cover(metadata, cover_cache)
+        if cover_result.success and cover_result.cover_data:
+            self._add_cover_frame(audio, cover_result)
+        else:
+            logger.info(f"No album cover found for '{metadata.album}'")
+        return cover_result
+
+    def _lookup_cover(
+        self, metadata: TrackMetadata, cover_cache: Optional["AlbumCoverCache"]
+    ) -> CoverResult:
+        """Get the album cover from the cache, retrieving it on a miss."""
         try:
-            # Try to get cover from cache first
-            cover_result = None
             if cover_cache and metadata.artist and metadata.album:
-                cover_result = cover_cache.get_cover(metadata.artist, metadata.album)
-
-            # If not in cache, retrieve it
-            if not cover_result:
-                cover_result = self.cover_retriever.retrieve_cover(metadata)
-                # Cache the result for future use
-                if cover_cache and metadata.artist and metadata.album:
-                    cover_cache.set_cover(metadata.artist, metadata.album, cover_result)
-
-            if cover_result.success and cover_result.cover_data:
-                # Create APIC frame for album cover
-                # Determine MIME type from data (basic check)
-                mime_type = self._guess_mime_type(cover_result.cover_data)
-
-                # Remove any existing APIC frames to avoid duplicates
-                audio.tags.delall("APIC")
-
-                # Add the cover art
-                apic = APIC(
-                    encoding=3,  # UTF-8
-                    mime=mime_type,
-                    type=3,  # Cover (front)
-                    desc="Cover",
-                    data=cover_result.cover_data
+                # One retrieval per album, even when its tracks download at once
+                return cover_cache.get_or_compute(
+                    metadata.artist,
+                    metadata.album,
+                    lambda: self.cover_retriever.retrieve_cover(metadata),
                 )
-                audio.tags.add(apic)
 
-                source = cover_result.source or "unknown"
-                confidence = cover_result.album_match_confidence
-                logger.info(f"Embedded album cover from {source} ({confidence})")
-            else:
-                logger.info(f"No album cover found for '{metadata.album}'")
+            return self.cover_retriever.retrieve_cover(metadata)
 
-            return cover_result
-
-        except Exception as exc:  # pragma: no cover - best effort cover embedding
-            logger.warning(f"Could not embed album cover: {exc}")
+        except Exception as exc:  # pragma: no cover - best effort cover retrieval
+            logger.warning(f"Could not retrieve album cover: {exc}")
             return CoverResult(
                 success=False,
-                error=f"Cover embedding failed: {str(exc)}",
+                error=f"Cover retrieval failed: {str(exc)}",
                 album_match_confidence="error"
             )
 
+    @staticmethod
+    def _add_text_frames(audio: MP3, metadata: TrackMetadata) -> None:
+        """Write the track's ID3 text tags with mutagen."""
+        audio.tags.add(TIT2(text=metadata.title))
+        audio.tags.add(TPE1(text=metadata.artist))
+
+        if metadata.album:
+            audio.tags.add(TALB(text=metadata.album))
+        if metadata.genre:
+            audio.tags.add(TCON(text=metadata.genre))
+        if metadata.year:
+            audio.tags.add(TYER(text=str(metadata.year)))
+        if metadata.track_number and metadata.total_tracks:
+            track_info = f"{metadata.track_number}/{metadata.total_tracks}"
+            audio.tags.add(TRCK(text=track_info))
+
+    def _add_cover_frame(self, audio: MP3, cover_result: CoverResult) -> None:
+        """Replace the file's front cover with the retrieved image."""
+        # Determine MIME type from data (basic check)
+        mime_type = self._guess_mime_type(cover_result.cover_data)
+
+        # Remove any existing APIC frames to avoid duplicates
+        audio.tags.delall("APIC")
+
+        # Add the cover art
+        apic = APIC(
+            encoding=3,  # UTF-8
+            mime=mime_type,
+            type=3,  # Cover (front)
+            desc="Cover",
+            data=cover_result.cover_data
+        )
+        audio.tags.add(apic)
+
+        source = cover_result.source or "unknown"
+        confidence = cover_result.album_match_confidence
+        logger.info(f"Embedded album cover from {source} ({confidence})")
+
     def _guess_mime_type(self, image_data: bytes) -> str:
         """Guess MIME type from image data."""
         if len(image_data) < 12:
             return "image/jpeg"
 
-        # Check for JPEG
-        if image_data[:2] == b'\xff\xd8':
-            return "image/jpeg"
-
-        # Check for PNG
-        if image_data[:8] == b'\x89PNG\r\n\x1a\n':
-            return "image/png"
+        for signature, mime_type in _IMAGE_SIGNATURES:
+            if image_data.startswith(signature):
+                return mime_type
 
-        # Check for GIF
-        if image_data[:6] in (b'GIF87a', b'GIF89a'):
-            return "image/gif"
+        # WebP is a RIFF container tagged "WEBP" after the chunk size
+        if image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
+            return "image/webp"
 
         # Default to JPEG
         return "image/jpeg"
 
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting to avoid YouTube bot detection."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-
-        self._last_request_time = time.time()
-
     def create_output_path(self, metadata: TrackMetadata, base_dir: Path) -> Path:
         """Create the output file path for a track."""
-        filename = self._render_filename(metadata)
-        sanitized = sanitize_filename(filename)
-        return (base_dir / sanitized).with_suffix(".mp3")
-
-    def _render_filename(self, metadata: TrackMetadata) -> str:
-        """Render a filename from the configured template."""
-        mapping = {
-            "artist": metadata.artist or "Unknown Artist",
-            "title": metadata.title or "Unknown Title",
-            "album": metadata.album or "",
-            "year": str(metadata.year) if metadata.year else "",
-            "track_number": str(metadata.track_number) if metadata.track_number else "",
-            "total_tracks": str(metadata.total_tracks) if metadata.total_tracks else "",
-        }
-
-        class _SafeDict(dict):
-            def __missing__(self, key: str) -> str:  # pragma: no cover - defensive
-                return ""
-
-        rendered = self.filename_template.format_map(_SafeDict(mapping))
-        return rendered.strip() or "Track"
-
+        return self.prepare_output_paths([metadata], base_dir)[0]
+
+    def prepare_output_paths(
+        self, tracks: List[TrackMetadata], base_dir: Path
+    ) -> List[Path]:
+        """Create output file paths for many tracks, parsing the template once.
+
+        Only the placeholders the template uses are rendered per track.
+        Collisions between the paths are left to the caller.
+        """
+        template = self.filename_template
+        fields = _template_fields(template)
+        paths: List[Path] = []
+        for metadata in tracks:
+            mapping = _SafeDict((name, render(metadata)) for name, render in fields)
+            filename = template.format_map(mapping).strip() or "Track"
+            paths.append((base_dir / sanitize_filename(filename)).with_suffix(".mp3"))
+        return paths
 
 
 __all__ = ["DownloadJob", "AudioDownloader", "ProgressCallback"]
@@ -4,14 +4,121 @@ from __future__ import annotations
 
 import re
 import json
+import threading
+import time
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .config import (
+    PLAYLIST_EXTRACT_WORKERS,
+    STRUCTURED_CACHE_SIZE,
+    STRUCTURED_CACHE_TTL,
+)
+from .utils.compat import DATACLASS_SLOTS
+from .utils.ydl import ThreadLocalYoutubeDL
+
+try:  # Optional fast JSON parser (pip install "youtube-to-mp3[fast]")
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Title separators, in the order they are tried: "Artist - Title",
+# "Artist – Title" (en dash), "Artist | Title" and "Artist: Title"
+_TITLE_SEPARATORS = ("-", "–", "|", ":")
+
+# Title artifacts removed in one pass: "(Official Video)"-style suffixes, and
+# everything after a pipe
+_TITLE_CLEANUP_RE = re.compile(
+    r"\s*\((?:Official|Music|Lyric|Audio|HD|4K)\s+"
+    r"(?:Video|Audio|Music Video|Lyric Video)\)"
+    r"|\s*\|.*$",
+    re.IGNORECASE,
+)
+
+_VIDEO_ID_RE = re.compile(
+    r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)"
+    r"([a-zA-Z0-9_-]{11})"
+)
+
+_INITIAL_DATA_MARKER = b"var ytInitialData = "
+# The object is assigned in its own inline script
+_INITIAL_DATA_END = b";</script>"
+# Top-level ytInitialData key holding the description panels
+_ENGAGEMENT_PANELS_KEY = b'"engagementPanels":'
+_JSON_DECODER = json.JSONDecoder()
+
+# A parsed "Music in this video" card, or None when the page has none
+_Card = Optional[Dict[str, str]]
+
+
+def _parse_initial_data(page: bytes) -> Optional[Dict[str, Any]]:
+    """Decode the ytInitialData object embedded in a watch page.
+
+    The raw page bytes are searched with ``bytes.find`` and only the object's
+    slice, up to the end of its script tag, is decoded (with orjson when it is
+    installed). If that slice is not valid JSON, the stdlib decoder parses
+    from the marker and stops at the end of the object instead.
+    """
+    start = page.find(_INITIAL_DATA_MARKER)
+    if start < 0:
+        return None
+    start += len(_INITIAL_DATA_MARKER)
+
+    data = None
+    end = page.find(_INITIAL_DATA_END, start)
+    if end >= 0:
+        try:
+            data = orjson.loads(page[start:end]) if orjson else json.loads(page[start:end])
+        except ValueError:
+            data = None
+    if data is None:
+        text = page[start:].decode("utf-8", errors="replace")
+        data, _ = _JSON_DECODER.raw_decode(text)
+    return data if isinstance(data, dict) else None
+
+
+def _parse_engagement_panels(page: bytes) -> Optional[List[Any]]:
+    """Decode only the ``engagementPanels`` list of a watch page's ytInitialData.
+
+    The panels are what the structured-description lookup reads, and they sit
+    after the much larger ``contents`` tree, so decoding just that array skips
+    building most of the object. The last occurrence of the key is used, and
+    only if the text after its value closes exactly one object, i.e. the key
+    is top-level; otherwise (or if it is missing) the whole object is decoded.
+    """
+    start = page.find(_INITIAL_DATA_MARKER)
+    if start < 0:
+        return None
 
-import yt_dlp
+    end = page.find(_INITIAL_DATA_END, start)
+    key = page.rfind(_ENGAGEMENT_PANELS_KEY, start, end) if end >= 0 else -1
+    if key >= 0:
+        text = page[key + len(_ENGAGEMENT_PANELS_KEY):end].decode(
+            "utf-8", errors="replace"
+        )
+        try:
+            panels, stop = _JSON_DECODER.raw_decode(
+                text, len(text) - len(text.lstrip())
+            )
+            # A nested key leaves extra closing brackets after this object
+            rest = '{"_":0' + text[stop:].rstrip()
+            _, closed = _JSON_DECODER.raw_decode(rest)
+        except ValueError:
+            panels, closed, rest = None, 0, ""
+        if isinstance(panels, list) and closed == len(rest):
+            return panels
 
+    data = _parse_initial_data(page)
+    return data.get("engagementPanels", []) if data else None
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class TrackMetadata:
     """Metadata for a single track."""
 
@@ -31,7 +138,7 @@ class TrackMetadata:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlaylistInfo:
     """Information about a playlist."""
 
@@ -45,18 +152,50 @@ class PlaylistInfo:
 class YouTubeExtractor:
     """Extracts metadata from YouTube URLs using yt-dlp and direct scraping."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = PLAYLIST_EXTRACT_WORKERS,
+        skip_tagged_watch_pages: bool = False,
+    ):
+        self.max_workers = max_workers
+        # Opt-in: skip the watch-page fetch for videos yt-dlp already tagged
+        # with track/artist/album. Saves a request per video, but loses the
+        # card's album cover, the highest-priority cover source.
+        self.skip_tagged_watch_pages = skip_tagged_watch_pages
+        # Playlists are listed flat; each entry is then resolved on its own so
+        # the per-video lookups can run in parallel
         self._ydl_opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "extract_flat": "in_playlist",
+            "skip_download": True,
+        }
+        self._entry_ydl_opts = {
             "quiet": True,
             "no_warnings": True,
             "extract_flat": False,
             "skip_download": True,
+            "noplaylist": True,
         }
+        # Long-lived yt-dlp instances (one per thread) and a persistent entry
+        # pool, so extractors stay warm across entries and extractions
+        self._ydl = ThreadLocalYoutubeDL(self._ydl_opts)
+        self._entry_ydl = ThreadLocalYoutubeDL(self._entry_ydl_opts)
+        self._entry_pool: Optional[ThreadPoolExecutor] = None
+        # Parsed cards by video ID, oldest first, with their fetch time; entry
+        # workers share it, hence the lock
+        self._structured_cache: "OrderedDict[str, Tuple[float, _Card]]" = OrderedDict()
+        self._structured_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept-Language": "en-US,en;q=0.9",
         })
+        # Every entry worker fetches a watch page, so keep a kept-alive
+        # connection per worker instead of discarding the overflow
+        adapter = HTTPAdapter(pool_maxsize=max(max_workers, DEFAULT_POOLSIZE))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def extract_metadata(self, url: str) -> Union[TrackMetadata, PlaylistInfo]:
         """
@@ -65,38 +204,70 @@ class YouTubeExtractor:
         Returns TrackMetadata for single videos, PlaylistInfo for playlists.
         """
         try:
-            with yt_dlp.YoutubeDL(self._ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = self._ydl.get().extract_info(url, download=False)
 
-                # Check if it's a playlist
-                if "entries" in info:
-                    return self._extract_playlist_info(info)
-                else:
-                    return self._extract_track_metadata(info)
+            # Check if it's a playlist
+            if "entries" in info:
+                return self._extract_playlist_info(info)
+            else:
+                return self._extract_track_metadata(info)
 
         except Exception as e:
             # Fallback: try to extract basic info from URL patterns
             return self._fallback_metadata_extraction(url, str(e))
 
+    def close(self) -> None:
+        """Shut down the entry pool and release yt-dlp and HTTP resources."""
+        if self._entry_pool is not None:
+            self._entry_pool.shutdown(wait=True)
+            self._entry_pool = None
+        self._ydl.close()
+        self._entry_ydl.close()
+        self.session.close()
+
     def _get_structured_metadata(self, url: str) -> Optional[Dict[str, str]]:
         """
         Extract "Golden Truth" music metadata from YouTube's ytInitialData.
         This captures the "Music in this video" section.
+
+        Results are cached by video ID for ``STRUCTURED_CACHE_TTL`` seconds,
+        keeping the ``STRUCTURED_CACHE_SIZE`` most recently used; failed page
+        fetches are not, so a retry hits the network again.
         """
+        video_id = self._extract_video_id(url)
+        if video_id:
+            with self._structured_lock:
+                entry = self._structured_cache.get(video_id)
+                now = time.monotonic()
+                if entry is not None and now - entry[0] < STRUCTURED_CACHE_TTL:
+                    self._structured_cache.move_to_end(video_id)
+                    return entry[1]
+
         try:
             response = self.session.get(url, timeout=10)
             if response.status_code != 200:
                 return None
+            page = response.content
+        except Exception:
+            return None
 
-            html = response.text
-            match = re.search(r"var ytInitialData = ({.*?});", html)
-            if not match:
+        result = self._parse_structured_metadata(page)
+        if video_id:
+            with self._structured_lock:
+                self._structured_cache[video_id] = (time.monotonic(), result)
+                self._structured_cache.move_to_end(video_id)
+                while len(self._structured_cache) > STRUCTURED_CACHE_SIZE:
+                    self._structured_cache.popitem(last=False)
+        return result
+
+    def _parse_structured_metadata(self, page: bytes) -> Optional[Dict[str, str]]:
+        """Read the "Music in this video" card from a watch page's raw HTML."""
+        try:
+            panels = _parse_engagement_panels(page)
+            if not panels:
                 return None
-
-            data = json.loads(match.group(1))
             
             # Safe traversal to find the structured description panel
-            panels = data.get("engagementPanels", [])
             structured_panel = next((
                 p for p in panels 
                 if self._get_path(p, ["engagementPanelSectionListRenderer", "panelIdentifier"]) == "engagement-panel-structured-description"
@@ -177,9 +348,13 @@ class YouTubeExtractor:
         source_url = info.get("webpage_url") or info.get("url")
         thumbnail = info.get("thumbnail")
 
-        # Try to get "Golden Truth" metadata from YouTube's structured description
+        # Try to get "Golden Truth" metadata from YouTube's structured description,
+        # unless configured to trust yt-dlp's music fields when all are present
         structured = None
-        if source_url:
+        skip_lookup = self.skip_tagged_watch_pages and bool(
+            info.get("track") and info.get("artist") and info.get("album")
+        )
+        if source_url and not skip_lookup:
             structured = self._get_structured_metadata(source_url)
 
         parsed = self.parse_title(title)
@@ -231,15 +406,17 @@ class YouTubeExtractor:
     def _extract_playlist_info(self, info: Dict[str, Any]) -> PlaylistInfo:
         """Extract metadata from a playlist info dict."""
         playlist_title = info.get("title", "Unknown Playlist")
-        entries = [entry for entry in info.get("entries", []) if entry]
+        resolved = self._extract_entries(
+            [entry for entry in info.get("entries", []) if entry]
+        )
+        entries = [entry for entry, _ in resolved]
         total_entries = len(entries)
 
         # Check if this is an album based on multiple heuristics
         is_album = self._is_album_playlist(info, entries)
 
         tracks: List[TrackMetadata] = []
-        for i, entry in enumerate(entries, 1):
-            metadata = self._extract_track_metadata(entry)
+        for i, (entry, metadata) in enumerate(resolved, 1):
             metadata.track_number = i
             metadata.total_tracks = total_entries
             metadata.extra["playlist_index"] = entry.get("playlist_index")
@@ -258,40 +435,74 @@ class YouTubeExtractor:
             total_tracks=total_entries,
         )
 
+    def _extract_entries(
+        self, entries: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], TrackMetadata]]:
+        """Resolve playlist entries concurrently, keeping playlist order."""
+        if len(entries) <= 1 or self.max_workers <= 1:
+            return [self._extract_entry(entry) for entry in entries]
+
+        if self._entry_pool is None:
+            self._entry_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="extract"
+            )
+        return list(self._entry_pool.map(self._extract_entry, entries))
+
+    def _extract_entry(
+        self, entry: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], TrackMetadata]:
+        """Fully extract a flat playlist entry and build its track metadata."""
+        if entry.get("_type") in ("url", "url_transparent"):
+            entry_url = entry.get("url") or entry.get("webpage_url")
+            try:
+                full_info = self._entry_ydl.get().extract_info(
+                    entry_url, download=False
+                )
+                if full_info:
+                    full_info.setdefault("playlist_index", entry.get("playlist_index"))
+                    entry = full_info
+            except Exception:
+                # Keep the flat entry; its title and URL are enough to download
+                pass
+
+        return entry, self._extract_track_metadata(entry)
+
     def _is_album_playlist(self, info: Dict[str, Any], entries: List[Dict[str, Any]]) -> bool:
         """Determine if a playlist represents an album using multiple heuristics."""
         # Direct playlist type indicator
         if info.get("playlist_type") == "album":
             return True
 
-        # Check if most tracks have the same album name
-        album_names = set()
-        for entry in entries[:10]:  # Check first 10 entries for performance
-            album = entry.get("album")
-            if album:
-                album_names.add(album.lower().strip())
-
-        # If most tracks share the same album name, it's likely an album
-        if len(album_names) == 1 and len(entries) > 3:
-            return True
-
         # Check playlist title patterns that suggest albums
         title_lower = info.get("title", "").lower()
         album_indicators = ["album", "lp", "ep", "single", "compilation"]
         if any(indicator in title_lower for indicator in album_indicators):
             return True
 
-        # Check if tracks have sequential track numbers
+        # Collect album names and track numbers in one pass over the first
+        # 10 entries (checked for performance)
+        album_names = set()
         track_numbers = []
-        for entry in entries[:10]:
+        for entry in islice(entries, 10):
+            album = entry.get("album")
+            if album:
+                album_names.add(album.lower().strip())
             track_num = entry.get("track_number") or entry.get("playlist_index")
             if track_num:
                 track_numbers.append(track_num)
 
+        # If most tracks share the same album name, it's likely an album
+        if len(album_names) == 1 and len(entries) > 3:
+            return True
+
         # If we have sequential track numbers, likely an album
+        # (distinct numbers spanning exactly their count form a run)
         if len(track_numbers) >= 3:
-            track_numbers.sort()
-            if track_numbers == list(range(min(track_numbers), max(track_numbers) + 1)):
+            unique_numbers = set(track_numbers)
+            if (
+                len(unique_numbers) == len(track_numbers)
+                and max(unique_numbers) - min(unique_numbers) + 1 == len(unique_numbers)
+            ):
                 return True
 
         return False
@@ -308,42 +519,29 @@ class YouTubeExtractor:
         # Clean the title
         clean_title = self._clean_title(title)
 
-        # Try different separator patterns
-        separators = [
-            r"\s*-\s*",  # "Artist - Title"
-            r"\s*–\s*",  # "Artist – Title" (em dash)
-            r"\s*\|\s*",  # "Artist | Title"
-            r"\s*:\s*",  # "Artist: Title"
-        ]
-
-        for sep in separators:
-            if re.search(sep, clean_title):
-                parts = re.split(sep, clean_title, maxsplit=1)
-                if len(parts) == 2:
-                    part1, part2 = parts
-
-                    # Heuristic: shorter part is likely artist
-                    if len(part1.split()) <= 3:
-                        return {"artist": part1.strip(), "title": part2.strip()}
-                    else:
-                        return {"title": part1.strip(), "artist": part2.strip()}
+        # Try separators in priority order ("-" wins over a later ":")
+        for separator in _TITLE_SEPARATORS:
+            # Surrounding whitespace is stripped below, so a plain partition
+            # matches what a whitespace-tolerant regex split would produce
+            part1, found, part2 = clean_title.partition(separator)
+            if found:
+                # Heuristic: shorter part is likely artist
+                if len(part1.split()) <= 3:
+                    return {"artist": part1.strip(), "title": part2.strip()}
+                else:
+                    return {"title": part1.strip(), "artist": part2.strip()}
 
         # No separator found, return original title
         return {"title": clean_title}
 
     def _clean_title(self, title: str) -> str:
         """Clean up common YouTube title artifacts."""
-        # Remove common suffixes
-        patterns = [
-            r"\s*\((Official|Music|Lyric|Audio|HD|4K)\s+(Video|Audio|Music Video|Lyric Video)\)",
-            r"\s*\|.*$",  # Remove everything after pipe
-        ]
-
-        clean = title
-        for pattern in patterns:
-            clean = re.sub(pattern, "", clean, flags=re.IGNORECASE)
+        # Every artifact starts with "(" or "|"; most titles have neither
+        if "(" not in title and "|" not in title:
+            return title.strip()
 
-        return clean.strip()
+        # Remove common suffixes
+        return _TITLE_CLEANUP_RE.sub("", title).strip()
 
     def _fallback_metadata_extraction(self, url: str, error: str) -> TrackMetadata:
         """Fallback metadata extraction when yt-dlp fails."""
@@ -358,16 +556,9 @@ class YouTubeExtractor:
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from URL."""
-        patterns = [
-            r"(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})",
-            r"youtube\.com\/embed\/([a-zA-Z0-9_-]{11})",
-            r"youtube\.com\/v\/([a-zA-Z0-9_-]{11})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            return match.group(1)
 
         return None
 
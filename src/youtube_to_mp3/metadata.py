@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from dataclasses import replace
 from typing import Dict, Optional
 
 from .extractor import TrackMetadata
@@ -14,27 +16,28 @@ class MetadataCleaner:
     def clean_track(
         metadata: TrackMetadata, default_genre: Optional[str] = None
     ) -> TrackMetadata:
-        """Return a sanitized copy of the provided metadata."""
-        cleaned = TrackMetadata(
+        """Return a sanitized copy of the provided metadata.
+
+        Only the cleaned fields are rebuilt and the rest are carried over; the
+        ``extra`` dict is copied so the two tracks never share it. Artist and
+        album names are interned, since the tracks of a playlist repeat them.
+        """
+        album = MetadataCleaner._clean_optional_string(metadata.album)
+        return replace(
+            metadata,
             title=MetadataCleaner._clean_string(metadata.title) or "Unknown Title",
-            artist=MetadataCleaner._clean_string(metadata.artist) or "Unknown Artist",
-            album=MetadataCleaner._clean_optional_string(metadata.album),
+            artist=sys.intern(
+                MetadataCleaner._clean_string(metadata.artist) or "Unknown Artist"
+            ),
+            album=sys.intern(album) if album else None,
             genre=MetadataCleaner._clean_optional_string(metadata.genre)
             or default_genre,
             year=MetadataCleaner._validate_year(metadata.year),
             track_number=MetadataCleaner._validate_track_number(metadata.track_number),
             total_tracks=MetadataCleaner._validate_track_number(metadata.total_tracks),
-            duration=metadata.duration,
-            source_url=metadata.source_url,
-            selected=metadata.selected,
-            thumbnail_url=metadata.thumbnail_url,
-            youtube_album_cover_url=getattr(metadata, "youtube_album_cover_url", None),
-            original_title=metadata.original_title,
             extra=dict(metadata.extra),
         )
 
-        return cleaned
-
     @staticmethod
     def _clean_string(value: Optional[str]) -> str:
         """Clean a string value."""
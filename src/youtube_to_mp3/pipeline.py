@@ -3,19 +3,48 @@
 from __future__ import annotations
 
 import asyncio
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from .album_cover_retriever import CoverResult
-from .config import AppConfig
+from .config import (
+    EXTRACT_CACHE_SIZE,
+    EXTRACT_CACHE_TTL,
+    SESSION_COVER_TTL,
+    SESSION_MISS_TTL,
+    AppConfig,
+)
+from .cover_cache import CoverCache
 from .downloader import AudioDownloader, DownloadJob, ProgressCallback
 from .extractor import PlaylistInfo, TrackMetadata, YouTubeExtractor
 from .metadata import MetadataCleaner
+from .utils.compat import DATACLASS_SLOTS
 from .utils.filesystem import sanitize_filename
+from .utils.rate_limit import AdaptiveConcurrencyLimiter
 
+# What the extractor returns for a URL
+_Extraction = Union[TrackMetadata, PlaylistInfo]
 
-@dataclass
+# Download errors that mean YouTube is throttling us
+_THROTTLE_MARKERS = ("HTTP Error 429", "Too Many Requests")
+
+
+def _is_throttled(error: Optional[str]) -> bool:
+    """Return True if a download error reports rate limiting."""
+    if not error:
+        return False
+    return any(marker in error for marker in _THROTTLE_MARKERS)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ExtractionResult:
     """Container for extracted metadata."""
 
@@ -26,29 +55,185 @@ class ExtractionResult:
     playlist_url: Optional[str] = None
 
 
+def _fold(value: str) -> str:
+    """Normalize a name for caseless, Unicode-insensitive comparison."""
+    return unicodedata.normalize("NFKC", value.strip()).casefold()
+
+
 @dataclass
 class AlbumCoverCache:
-    """Cache for album covers to avoid duplicate API calls."""
+    """Cache for album covers to avoid duplicate API calls.
+
+    Safe to share between download threads: a retrieval in flight is tracked
+    as pending, and other threads asking for the same album wait for it.
+    At most ``maxsize`` covers are kept; the least recently used go first.
+    Covers expire ``ttl`` seconds after they are stored and are then looked
+    up again, checked lazily on access. Failed lookups are cached too, so the
+    other tracks of an album skip them, but only for ``negative_ttl``.
+    """
 
-    def __init__(self):
-        self._cache: Dict[str, CoverResult] = {}
+    __slots__ = (
+        "_cache", "_pending", "_lock", "_maxsize", "_ttl", "_negative_ttl", "_clock"
+    )
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = SESSION_COVER_TTL,
+        negative_ttl: float = SESSION_MISS_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # Each entry holds its expiry time on ``clock`` and the cover
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, CoverResult]]" = (
+            OrderedDict()
+        )
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._clock = clock
+        self._pending: Dict[Tuple[str, str], threading.Event] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def make_key(artist: str, album: str) -> Tuple[str, str]:
+        """Return the case-insensitive cache key for an artist/album pair.
+
+        Unicode compatibility variants (full-width letters, ligatures) are
+        folded together so they share one cover. Keys are memoized, since
+        every track of an album asks for the same one, and interned, so
+        different spellings of an album share one key object.
+        """
+        return (sys.intern(_fold(artist)), sys.intern(_fold(album)))
 
     def get_cover(self, artist: str, album: str) -> Optional[CoverResult]:
-        """Get cached cover for artist/album combination."""
-        key = f"{artist}|{album}".lower().strip()
-        return self._cache.get(key)
+        """Get cached cover, waiting for it if a retrieval is in flight.
+
+        The cached result is returned as-is, so every track of an album shares
+        one copy of the (immutable) cover bytes.
+        """
+        key = self.make_key(artist, album)
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            pending.wait()
+        with self._lock:
+            return self._touch(key)
+
+    def get_or_compute(
+        self, artist: str, album: str, factory: Callable[[], CoverResult]
+    ) -> CoverResult:
+        """Return the cached cover, retrieving it with ``factory`` at most once.
+
+        Concurrent callers for the same album wait for the first caller's
+        retrieval instead of issuing their own.
+        """
+        key = self.make_key(artist, album)
+        while True:
+            with self._lock:
+                cached = self._touch(key)
+                if cached is not None:
+                    return cached
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    break
+            # Someone else is retrieving it; if they give up, take over
+            pending.wait()
+
+        try:
+            cover_result = factory()
+        except BaseException:
+            with self._lock:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+            pending.set()
+            raise
+
+        self.set_cover(artist, album, cover_result)
+        return cover_result
+
+    def has_cover(self, artist: str, album: str) -> bool:
+        """Return True if a cover is cached or being retrieved, without waiting."""
+        key = self.make_key(artist, album)
+        with self._lock:
+            return self._touch(key) is not None or key in self._pending
 
     def set_cover(self, artist: str, album: str, cover_result: CoverResult) -> None:
         """Cache cover for artist/album combination."""
-        key = f"{artist}|{album}".lower().strip()
-        self._cache[key] = cover_result
+        key = self.make_key(artist, album)
+        ttl = self._ttl if cover_result.success else self._negative_ttl
+        with self._lock:
+            self._cache[key] = (self._clock() + ttl, cover_result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+    def _touch(self, key: Tuple[str, str]) -> Optional[CoverResult]:
+        """Return the unexpired cover for ``key`` and mark it most recently used.
+
+        Expired entries are dropped here. Callers must hold the lock.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, cover_result = entry
+        if expires_at <= self._clock():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return cover_result
+
+    def mark_pending(self, artist: str, album: str) -> None:
+        """Announce that a cover for this combination is being retrieved."""
+        key = self.make_key(artist, album)
+        with self._lock:
+            if self._touch(key) is None:
+                self._pending.setdefault(key, threading.Event())
+
+    def claim_pending(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        """Mark every uncached, idle key as pending and return the ones claimed.
+
+        ``keys`` must already be normalized with :meth:`make_key`; the whole
+        batch is checked and claimed under a single lock acquisition.
+        """
+        with self._lock:
+            claimed = [
+                key
+                for key in dict.fromkeys(keys)
+                if key not in self._pending and self._touch(key) is None
+            ]
+            for key in claimed:
+                self._pending[key] = threading.Event()
+        return claimed
+
+    def release_pending(self, keys: Optional[Iterable[Tuple[str, str]]] = None) -> None:
+        """Wake any waiters for retrievals that will not complete.
+
+        Only ``keys`` (as returned by :meth:`claim_pending`) are released, so
+        other batches' lookups stay pending; without ``keys`` all are.
+        """
+        with self._lock:
+            if keys is None:
+                keys = list(self._pending)
+            pending = [self._pending.pop(key, None) for key in keys]
+        for event in pending:
+            if event is not None:
+                event.set()
 
     def clear(self) -> None:
         """Clear the cache."""
-        self._cache.clear()
+        self.release_pending()
+        with self._lock:
+            self._cache.clear()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DownloadOutcome:
     """Outcome of an individual download."""
 
@@ -70,17 +255,39 @@ class DownloadPipeline:
         downloader: Optional[AudioDownloader] = None,
     ) -> None:
         self.config = config
-        self.extractor = extractor or YouTubeExtractor()
+        self.extractor = extractor or YouTubeExtractor(
+            skip_tagged_watch_pages=config.skip_tagged_watch_pages
+        )
         self.downloader = downloader or AudioDownloader(
             rate_limit_delay=config.rate_limit_delay,
             audio_quality=config.audio_quality,
             filename_template=config.filename_template,
+            cover_cache=CoverCache(config.cover_cache_directory)
+            if config.cover_cache_enabled
+            else None,
         )
         self.cover_cache = AlbumCoverCache()
+        # Recent extractor results by URL, oldest first, with their fetch time
+        self._extract_cache: "OrderedDict[str, Tuple[float, _Extraction]]" = (
+            OrderedDict()
+        )
+        # Kept across downloads so each worker thread reuses its warm yt-dlp
+        self._download_pool: Optional[ThreadPoolExecutor] = None
+        # How many of the pool's workers may download at once; shrinks when
+        # YouTube throttles and grows back while downloads succeed
+        self.concurrency = AdaptiveConcurrencyLimiter(config.download_workers)
+
+    def close(self) -> None:
+        """Release resources held by the workers, extractor and downloader."""
+        if self._download_pool is not None:
+            self._download_pool.shutdown(wait=True)
+            self._download_pool = None
+        self.extractor.close()
+        self.downloader.close()
 
     def extract(self, url: str) -> ExtractionResult:
         """Extract metadata for a YouTube URL."""
-        info = self.extractor.extract_metadata(url)
+        info = self._extract_cached(url)
 
         if isinstance(info, PlaylistInfo):
             tracks = [
@@ -102,6 +309,30 @@ class DownloadPipeline:
         )
         return ExtractionResult(url=url, tracks=[cleaned_track], is_playlist=False)
 
+    def _extract_cached(self, url: str) -> _Extraction:
+        """Return the extractor's result for ``url``, reusing a recent one.
+
+        Results are kept for ``EXTRACT_CACHE_TTL`` seconds, so resubmitting a
+        URL skips the yt-dlp round trip. Fallback results (no source URL) are
+        not kept, so a failed extraction is retried. Callers only ever see
+        cleaned copies, so UI edits never reach a cached result.
+        """
+        now = time.monotonic()
+        entry = self._extract_cache.get(url)
+        if entry is not None and now - entry[0] < EXTRACT_CACHE_TTL:
+            self._extract_cache.move_to_end(url)
+            return entry[1]
+
+        info = self.extractor.extract_metadata(url)
+        if isinstance(info, PlaylistInfo) or info.source_url:
+            self._extract_cache[url] = (now, info)
+            self._extract_cache.move_to_end(url)
+            while len(self._extract_cache) > EXTRACT_CACHE_SIZE:
+                self._extract_cache.popitem(last=False)
+        else:
+            self._extract_cache.pop(url, None)
+        return info
+
     def create_download_jobs(
         self,
         tracks: List[TrackMetadata],
@@ -116,113 +347,174 @@ class DownloadPipeline:
             if playlist_folder:
                 target_dir = base_dir / playlist_folder
 
-        jobs: List[DownloadJob] = []
-        used_names: set[str] = set()
-        for metadata in tracks:
-            if not metadata.selected:
-                continue
-
-            url = metadata.source_url
-            if not url:
-                raise ValueError("Missing source URL for track; cannot download")
-
-            output_path = self.downloader.create_output_path(metadata, target_dir)
-            output_path = self._ensure_unique_path(output_path, used_names)
-            jobs.append(
-                DownloadJob(url=url, metadata=metadata, output_path=output_path)
+        selected = [metadata for metadata in tracks if metadata.selected]
+        if any(not metadata.source_url for metadata in selected):
+            raise ValueError("Missing source URL for track; cannot download")
+
+        # List the target folder once instead of probing it for every track
+        taken_names = self._existing_names(target_dir)
+        next_counters: Dict[str, int] = {}
+        output_paths = self.downloader.prepare_output_paths(selected, target_dir)
+
+        ensure_unique = self._ensure_unique_path
+        return [
+            DownloadJob(
+                url=metadata.source_url,
+                metadata=metadata,
+                output_path=ensure_unique(output_path, taken_names, next_counters),
             )
-
-        return jobs
+            for metadata, output_path in zip(selected, output_paths)
+        ]
 
     async def download(
         self,
         jobs: List[DownloadJob],
         progress_callback: Optional[ProgressCallback] = None,
     ) -> List[DownloadOutcome]:
-        """Download jobs asynchronously via a background thread."""
+        """Download jobs concurrently on a bounded pool of background threads."""
 
         if not jobs:
             return []
 
-        # Pre-cache album covers for all unique artist/album combinations
-        await self._pre_cache_album_covers(jobs)
+        # Retrieve album covers in the background so lookups overlap the first
+        # downloads; tagging waits only on albums whose cover is still in flight
+        unique_albums = self._find_uncached_albums(jobs)
+        cover_task = asyncio.create_task(self._pre_cache_album_covers(unique_albums))
 
-        def _run_download() -> List[DownloadOutcome]:
-            outcomes: List[DownloadOutcome] = []
-            total = len(jobs)
+        total = len(jobs)
+        concurrency = self.concurrency
 
-            for index, job in enumerate(jobs, start=1):
+        def _download_one(index: int, job: DownloadJob) -> DownloadOutcome:
+            concurrency.acquire()
+            throttled = False
+            try:
                 job.status = "in_progress"
                 if progress_callback:
                     progress_callback(index, total, job)
 
-                download_result = self.downloader.download_track_with_cache(job, self.cover_cache)
-
-                if progress_callback:
-                    progress_callback(index, total, job)
-
-                cover_result = download_result.cover_result
-                outcomes.append(
-                    DownloadOutcome(
-                        job=job,
-                        success=download_result.success,
-                        error=download_result.error,
-                        cover_success=cover_result.success if cover_result else False,
-                        cover_source=cover_result.source if cover_result else None,
-                        cover_confidence=(
-                            cover_result.album_match_confidence if cover_result else None
-                        ),
-                    )
+                download_result = self.downloader.download_track_with_cache(
+                    job, self.cover_cache
                 )
+                throttled = _is_throttled(download_result.error)
+            finally:
+                concurrency.release(throttled)
+
+            if progress_callback:
+                progress_callback(index, total, job)
+
+            cover_result = download_result.cover_result
+            return DownloadOutcome(
+                job=job,
+                success=download_result.success,
+                error=download_result.error,
+                cover_success=cover_result.success if cover_result else False,
+                cover_source=cover_result.source if cover_result else None,
+                cover_confidence=(
+                    cover_result.album_match_confidence if cover_result else None
+                ),
+            )
 
-            return outcomes
-
-        return await asyncio.to_thread(_run_download)
-
-    async def _pre_cache_album_covers(self, jobs: List[DownloadJob]) -> None:
-        """Pre-cache album covers for all unique artist/album combinations."""
-        # Find unique artist/album combinations that need cover retrieval
-        unique_albums: Dict[tuple[str, str], Optional[str]] = {}
+        # Downloads are network and ffmpeg bound, so a few run side by side;
+        # outcomes keep the job order regardless of completion order
+        if self._download_pool is None:
+            self._download_pool = ThreadPoolExecutor(
+                max_workers=self.config.download_workers, thread_name_prefix="download"
+            )
+        pool = self._download_pool
 
+        def _run_download() -> List[DownloadOutcome]:
+            return list(pool.map(_download_one, range(1, total + 1), jobs))
+
+        try:
+            return await asyncio.to_thread(_run_download)
+        finally:
+            await cover_task
+
+    def _find_uncached_albums(
+        self, jobs: List[DownloadJob]
+    ) -> Dict[tuple[str, str], TrackMetadata]:
+        """Find each uncached artist/album's first track and mark it as pending."""
+        make_key = AlbumCoverCache.make_key
+        candidates: Dict[tuple[str, str], TrackMetadata] = {}
+        seen: set[tuple[str, str]] = set()
+
+        # Normalize each distinct spelling once; tracks of an album usually
+        # repeat it verbatim. Only the first track of an album is kept.
         for job in jobs:
             metadata = job.metadata
             if metadata.artist and metadata.album:
-                # Only cache if we don't already have this combination
-                key = (metadata.artist, metadata.album)
-                if key not in unique_albums and not self.cover_cache.get_cover(*key):
-                    unique_albums[key] = getattr(metadata, "youtube_album_cover_url", None)
-
-        # Retrieve covers for unique combinations
-        if unique_albums:
-            def _retrieve_covers():
-                for (artist, album), yt_cover_url in unique_albums.items():
-                    metadata = TrackMetadata(
-                        title="Unknown Title",
-                        artist=artist,
-                        album=album,
-                        youtube_album_cover_url=yt_cover_url
-                    )
-                    cover_result = self.downloader.cover_retriever.retrieve_cover(metadata)
-                    self.cover_cache.set_cover(artist, album, cover_result)
-
-            await asyncio.to_thread(_retrieve_covers)
-
-    def _ensure_unique_path(self, output_path: Path, used_names: set[str]) -> Path:
-        """Return a non-colliding output path for this batch."""
+                raw = (metadata.artist, metadata.album)
+                if raw in seen:
+                    continue
+                seen.add(raw)
+                candidates.setdefault(make_key(*raw), metadata)
+
+        # Only look up combinations that are neither cached nor in flight
+        return {
+            key: candidates[key] for key in self.cover_cache.claim_pending(candidates)
+        }
+
+    async def _pre_cache_album_covers(
+        self, unique_albums: Dict[tuple[str, str], TrackMetadata]
+    ) -> None:
+        """Pre-cache album covers, one lookup per artist/album combination."""
+        if not unique_albums:
+            return
+
+        # Look each album up through a real track of it, so title-based
+        # fallbacks (recording and track searches) have something to match
+        keys = list(unique_albums)
+        metadatas = list(unique_albums.values())
+
+        # Publish each cover as soon as it resolves so waiting downloads resume
+        def _on_result(index: int, cover_result: CoverResult) -> None:
+            self.cover_cache.set_cover(*keys[index], cover_result)
+
+        try:
+            await asyncio.to_thread(
+                self.downloader.cover_retriever.retrieve_covers, metadatas, _on_result
+            )
+        finally:
+            self.cover_cache.release_pending(keys)
+
+    @staticmethod
+    def _existing_names(directory: Path) -> set[str]:
+        """Return the casefolded names of the files already in ``directory``."""
+        try:
+            return {path.name.casefold() for path in directory.iterdir()}
+        except OSError:
+            return set()
+
+    def _ensure_unique_path(
+        self,
+        output_path: Path,
+        taken_names: set[str],
+        next_counters: Optional[Dict[str, int]] = None,
+    ) -> Path:
+        """Return a non-colliding output path for this batch.
+
+        Names are compared casefolded so tracks never collide on
+        case-insensitive filesystems either. ``next_counters`` remembers the
+        next free " (n)" suffix per name, so many tracks sharing a name do
+        not rescan the numbers already handed out.
+        """
         candidate = output_path.name
-        if candidate not in used_names and not output_path.exists():
-            used_names.add(candidate)
+        folded = candidate.casefold()
+        if folded not in taken_names:
+            taken_names.add(folded)
             return output_path
 
+        if next_counters is None:
+            next_counters = {}
         stem = output_path.stem
         suffix = output_path.suffix
-        counter = 1
+        counter = next_counters.get(folded, 1)
         while True:
             candidate = f"{stem} ({counter}){suffix}"
-            candidate_path = output_path.with_name(candidate)
-            if candidate not in used_names and not candidate_path.exists():
-                used_names.add(candidate)
-                return candidate_path
+            if candidate.casefold() not in taken_names:
+                taken_names.add(candidate.casefold())
+                next_counters[folded] = counter + 1
+                return output_path.with_name(candidate)
             counter += 1
 
 
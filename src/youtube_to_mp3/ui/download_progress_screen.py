@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List, Sequence, TYPE_CHECKING, cast
+from typing import List, Optional, Sequence, TYPE_CHECKING, Tuple, cast
 
 from textual.containers import Vertical
 from textual.screen import Screen
@@ -15,6 +15,9 @@ from ..pipeline import DownloadOutcome
 if TYPE_CHECKING:  # pragma: no cover - type hint support
     from ..app import YouTubeToMp3App
 
+# (index, total, job, status, error) as reported by the download pipeline
+ProgressEvent = Tuple[int, int, DownloadJob, str, Optional[str]]
+
 
 class DownloadProgressScreen(Screen[List[DownloadOutcome]]):
     """Visualise download progress and emit results when finished."""
@@ -29,6 +32,8 @@ class DownloadProgressScreen(Screen[List[DownloadOutcome]]):
             self.progress = ProgressBar(total=len(self.jobs))
         self.log_widget = Log()
         self._completed = 0
+        self._log_buffer: List[str] = []
+        self._pending_advance = 0
 
     def compose(self):
         with Vertical(id="progress-container"):
@@ -42,31 +47,74 @@ class DownloadProgressScreen(Screen[List[DownloadOutcome]]):
 
     async def _run_downloads(self) -> None:
         app = cast("YouTubeToMp3App", self.app)
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue[Optional[ProgressEvent]] = asyncio.Queue()
 
+        # Hand events to the UI loop without blocking the download worker;
+        # status and error are captured now, since the job keeps changing
         def progress_callback(index: int, total: int, job: DownloadJob) -> None:
-            app.call_from_thread(self._handle_progress_update, index, total, job)
-
-        outcomes = await app.perform_download(self.jobs, progress_callback)
+            event = (index, total, job, job.status, job.error)
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        drain = asyncio.create_task(self._drain_progress(events))
+        try:
+            outcomes = await app.perform_download(self.jobs, progress_callback)
+        finally:
+            events.put_nowait(None)
+            await drain
         self.dismiss(outcomes)
         await app.handle_download_complete(outcomes)
 
-    def _handle_progress_update(self, index: int, total: int, job: DownloadJob) -> None:
-        if job.status == "in_progress":
-            self.log_widget.write(
+    async def _drain_progress(
+        self, events: asyncio.Queue[Optional[ProgressEvent]]
+    ) -> None:
+        """Apply queued progress events, rendering each burst in one update."""
+        while True:
+            batch = [await events.get()]
+            while not events.empty():
+                batch.append(events.get_nowait())
+            with self.app.batch_update():
+                for event in batch:
+                    if event is None:
+                        self._flush_progress()
+                        return
+                    self._handle_progress_update(*event)
+                self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        """Write buffered log lines and advance the bar once per burst."""
+        if self._log_buffer:
+            self.log_widget.write_lines(self._log_buffer)
+            self._log_buffer.clear()
+        if self._pending_advance:
+            self.progress.advance(self._pending_advance)
+            self._pending_advance = 0
+
+    def _handle_progress_update(
+        self,
+        index: int,
+        total: int,
+        job: DownloadJob,
+        status: str,
+        error: Optional[str] = None,
+    ) -> None:
+        # Lines are buffered and written by _flush_progress
+        if status == "in_progress":
+            self._log_buffer.append(
                 f"[{index}/{total}] Starting {job.metadata.artist} - {job.metadata.title}"
             )
         else:
-            if job.status == "completed":
-                self.log_widget.write(
+            if status == "completed":
+                self._log_buffer.append(
                     f"[{index}/{total}] Finished {job.metadata.artist} - {job.metadata.title}"
                 )
             else:
-                self.log_widget.write(
+                self._log_buffer.append(
                     f"[{index}/{total}] Failed {job.metadata.artist} - "
-                    f"{job.metadata.title}: {job.error}"
+                    f"{job.metadata.title}: {error}"
                 )
             self._completed += 1
-            self.progress.advance(1)
+            self._pending_advance += 1
 
 
 __all__ = ["DownloadProgressScreen"]
@@ -33,8 +33,10 @@ class DownloadSummaryScreen(Screen):
         self.extraction = extraction
         self.outcomes = outcomes
         self.output_directory = output_directory
-        self.successes = [outcome for outcome in outcomes if outcome.success]
-        self.failures = [outcome for outcome in outcomes if not outcome.success]
+        self.successes: List[DownloadOutcome] = []
+        self.failures: List[DownloadOutcome] = []
+        for outcome in outcomes:
+            (self.successes if outcome.success else self.failures).append(outcome)
 
     def compose(self):
         success_count = len(self.successes)
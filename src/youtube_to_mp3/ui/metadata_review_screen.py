@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import replace
-from typing import List, Optional, TYPE_CHECKING, Callable, cast
+from typing import Dict, List, Optional, Set, TYPE_CHECKING, Callable, cast
 
 from textual import events
 from textual.binding import Binding
@@ -18,6 +18,9 @@ from ..extractor import TrackMetadata
 if TYPE_CHECKING:  # pragma: no cover - for typing only
     from ..app import YouTubeToMp3App
 
+# Column keys in display order, matching _row_values
+_COLUMN_KEYS = ("index", "selected", "title", "artist", "album", "year", "duration")
+
 
 class TrackEditModal(Screen):
     """Modal dialog for editing a single track's metadata."""
@@ -159,6 +162,13 @@ class MetadataReviewScreen(Screen):
         super().__init__()
         self.extraction = extraction
         self.table: DataTable = DataTable(zebra_stripes=True)
+        self._default_genre: Optional[str] = None
+        # Cell values currently shown for each row, so refreshes skip the rest
+        self._rendered_rows: Dict[int, List[str]] = {}
+        # Indexes of the selected tracks, kept in step with track.selected
+        self._selected: Set[int] = {
+            idx for idx, track in enumerate(extraction.tracks) if track.selected
+        }
 
     def compose(self):
         with Vertical(id="metadata-container"):
@@ -176,6 +186,7 @@ class MetadataReviewScreen(Screen):
                 yield Button("Back", id="back", variant="default")
 
     def on_mount(self) -> None:
+        self._default_genre = self._lookup_default_genre()
         self.table.focus()
         self._setup_table()
 
@@ -191,8 +202,13 @@ class MetadataReviewScreen(Screen):
             ("Duration", "duration"),
         )
 
-        for idx, track in enumerate(self.extraction.tracks):
-            self.table.add_row(*self._row_values(idx, track), key=str(idx))
+        # Render the whole table once rather than after every row
+        self._rendered_rows.clear()
+        with self.app.batch_update():
+            for idx, track in enumerate(self.extraction.tracks):
+                values = self._row_values(idx, track)
+                self._rendered_rows[idx] = values
+                self.table.add_row(*values, key=str(idx))
 
     def _row_values(self, index: int, track: TrackMetadata) -> List[str]:
         duration = (
@@ -216,11 +232,14 @@ class MetadataReviewScreen(Screen):
     def _refresh_row(self, row_index: int) -> None:
         row_key = str(row_index)
         track = self.extraction.tracks[row_index]
-        for column_key, value in zip(
-            ["index", "selected", "title", "artist", "album", "year", "duration"],
-            self._row_values(row_index, track),
-        ):
-            self.table.update_cell(row_key, column_key, value)
+        values = self._row_values(row_index, track)
+        previous = self._rendered_rows.get(row_index)
+        with self.app.batch_update():
+            for position, (column_key, value) in enumerate(zip(_COLUMN_KEYS, values)):
+                # Only touch cells whose text changed (a toggle flips just one)
+                if previous is None or previous[position] != value:
+                    self.table.update_cell(row_key, column_key, value)
+        self._rendered_rows[row_index] = values
 
     def _require_current_track(self) -> Optional[int]:
         row_index = self.table.cursor_row
@@ -235,6 +254,7 @@ class MetadataReviewScreen(Screen):
             return
         track = self.extraction.tracks[row_index]
         track.selected = not track.selected
+        self._selected.symmetric_difference_update((row_index,))
         self._refresh_row(row_index)
 
     async def action_edit_track(self) -> None:
@@ -253,10 +273,7 @@ class MetadataReviewScreen(Screen):
         await self.app.push_screen(TrackEditModal(track, edit_callback))
 
     async def action_bulk_edit(self) -> None:
-        selected_indexes = [
-            idx for idx, track in enumerate(self.extraction.tracks) if track.selected
-        ]
-        if not selected_indexes:
+        if not self._selected:
             self.notify(
                 "Select at least one track to apply bulk edits.", severity="warning"
             )
@@ -265,21 +282,22 @@ class MetadataReviewScreen(Screen):
         def bulk_callback(result: Optional[dict]) -> None:
             if not result:
                 return
-            for idx in selected_indexes:
-                track = self.extraction.tracks[idx]
-                updated = replace(
-                    track,
-                    album=result.get("album", track.album),
-                    genre=result.get("genre", track.genre),
-                    year=result.get("year", track.year),
-                )
-                self.extraction.tracks[idx] = self._clean_track(updated)
-                self._refresh_row(idx)
+            with self.app.batch_update():
+                for idx in sorted(self._selected):
+                    track = self.extraction.tracks[idx]
+                    updated = replace(
+                        track,
+                        album=result.get("album", track.album),
+                        genre=result.get("genre", track.genre),
+                        year=result.get("year", track.year),
+                    )
+                    self.extraction.tracks[idx] = self._clean_track(updated)
+                    self._refresh_row(idx)
 
         await self.app.push_screen(BulkEditModal(bulk_callback))
 
     async def action_download(self) -> None:
-        if not any(track.selected for track in self.extraction.tracks):
+        if not self._selected:
             self.notify("Select at least one track to download.", severity="warning")
             return
 
@@ -305,12 +323,11 @@ class MetadataReviewScreen(Screen):
             await self.action_toggle_select()
 
     def _clean_track(self, metadata: TrackMetadata) -> TrackMetadata:
+        return MetadataCleaner.clean_track(metadata, default_genre=self._default_genre)
+
+    def _lookup_default_genre(self) -> Optional[str]:
         app = self.app
-        default_genre = None
         try:  # pragma: no branch - attribute access helper
-            default_genre = getattr(
-                cast("YouTubeToMp3App", app).config, "default_genre", None
-            )
+            return getattr(cast("YouTubeToMp3App", app).config, "default_genre", None)
         except AttributeError:  # pragma: no cover - defensive
-            default_genre = None
-        return MetadataCleaner.clean_track(metadata, default_genre=default_genre)
+            return None
@@ -45,6 +45,20 @@ class URLInputScreen(Screen):
     }
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Keep direct references; these are touched on every submission
+        self.url_input = Input(
+            placeholder="https://youtu.be/... or https://www.youtube.com/...",
+            id="url-input",
+        )
+        self.status = Static("", id="status")
+        self._toggleable = (
+            self.url_input,
+            Button("Continue", variant="primary", id="continue-btn"),
+            Button("Quit", variant="default", id="quit-btn"),
+        )
+
     def compose(self):
         with Vertical():
             with Center():
@@ -56,28 +70,22 @@ class URLInputScreen(Screen):
                 )
 
             with Center():
-                yield Input(
-                    placeholder="https://youtu.be/... or https://www.youtube.com/...",
-                    id="url-input",
-                )
+                yield self.url_input
 
             with Center():
                 with Horizontal(id="button-container"):
-                    yield Button("Continue", variant="primary", id="continue-btn")
-                    yield Button("Quit", variant="default", id="quit-btn")
+                    yield from self._toggleable[1:]
 
             with Center():
-                yield Static("", id="status")
+                yield self.status
 
     def on_mount(self) -> None:
-        input_field = self.query_one("#url-input", Input)
-        input_field.focus()
+        self.url_input.focus()
         self._set_status("")
 
     def on_show(self) -> None:
         """Called when the screen becomes visible."""
-        input_field = self.query_one("#url-input", Input)
-        input_field.focus()
+        self.url_input.focus()
         self._set_ui_enabled(True)
         self._set_status("")
 
@@ -86,8 +94,7 @@ class URLInputScreen(Screen):
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "continue-btn":
-            input_field = self.query_one("#url-input", Input)
-            await self._handle_submission(input_field.value)
+            await self._handle_submission(self.url_input.value)
         elif event.button.id == "quit-btn":
             self.app.exit()
 
@@ -122,20 +129,19 @@ class URLInputScreen(Screen):
         await app.start_metadata_flow(url)
 
     def _set_ui_enabled(self, enabled: bool) -> None:
-        for widget in self.query("Button, Input"):
-            widget.disabled = not enabled
+        with self.app.batch_update():
+            for widget in self._toggleable:
+                widget.disabled = not enabled
 
     def _set_status(self, message: str) -> None:
-        status = self.query_one("#status", Static)
-        status.update(message)
+        self.status.update(message)
 
     async def handle_url_from_clipboard(self, url: str) -> None:
         await self._handle_submission(url)
 
     def reset(self) -> None:
         """Clear the input and restore focus."""
-        input_field = self.query_one("#url-input", Input)
-        input_field.value = ""
-        input_field.focus()
+        self.url_input.value = ""
+        self.url_input.focus()
         self._set_ui_enabled(True)
         self._set_status("")
@@ -0,0 +1,13 @@
+"""Helpers for differences between supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments that give a dataclass ``__slots__`` where supported
+# (``@dataclass(slots=True)`` was added in Python 3.10).
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+__all__ = ["DATACLASS_SLOTS"]
@@ -1,14 +1,38 @@
 """Filesystem utilities for cross-platform compatibility."""
 
+import os
 import platform
+import re
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\s\-\.]")
 
+# The same rule as a byte translation table for the common all-ASCII name;
+# bytes.translate is a flat table lookup, much cheaper than the regex
+_ASCII_UNSAFE_TABLE = bytes(
+    ord("_") if _UNSAFE_FILENAME_CHARS.match(chr(code)) else code
+    for code in range(256)
+)
+
+
+@lru_cache(maxsize=1)
+def _system() -> str:
+    """Return the platform name; it cannot change while the process runs."""
+    return platform.system()
+
+
+@lru_cache(maxsize=1)
 def get_music_directory() -> Path:
-    """Get the default music directory for the current platform."""
-    system = platform.system()
+    """Get the default music directory for the current platform.
+
+    The result is computed once per process, so the XDG user-dirs file is
+    read at most once.
+    """
+    system = _system()
 
     if system == "Windows":
         # Windows: C:\Users\<username>\Music
@@ -27,14 +51,14 @@ def get_music_directory() -> Path:
 def get_xdg_music_dir() -> Optional[Path]:
     """Get the XDG music directory from user-dirs.dirs."""
     try:
-        user_dirs_file = Path.home() / ".config" / "user-dirs.dirs"
-        if user_dirs_file.exists():
-            content = user_dirs_file.read_text()
-            for line in content.splitlines():
+        home = Path.home()
+        # Stream the file; the music entry is usually near the top
+        with (home / ".config" / "user-dirs.dirs").open(encoding="utf-8") as lines:
+            for line in lines:
                 if line.startswith("XDG_MUSIC_DIR"):
                     # Extract path from "XDG_MUSIC_DIR="$HOME/Music""
-                    path_part = line.split("=", 1)[1].strip('"')
-                    path = Path(path_part.replace("$HOME", str(Path.home())))
+                    _, _, path_part = line.rstrip("\r\n").partition("=")
+                    path = Path(path_part.strip('"').replace("$HOME", str(home)))
                     if path.exists():
                         return path
     except Exception:
@@ -47,20 +71,20 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
-    """Sanitize a filename for the current filesystem."""
-    # Characters that are problematic on most filesystems
-    invalid_chars = '<>:"/\\|?*'
-
-    # Replace invalid characters with underscores
-    sanitized = filename
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, "_")
-
-    # Remove or replace other problematic characters
-    import re
-
-    sanitized = re.sub(r"[^\w\s\-\.]", "_", sanitized)
+    """Sanitize a filename for the current filesystem.
+
+    Results are memoized; the output depends only on the input string.
+    """
+    # Replace anything but word characters, whitespace, dashes and dots; this
+    # covers the characters that are invalid on most filesystems (<>:"/\|?*)
+    if filename.isascii():
+        sanitized = (
+            filename.encode("ascii").translate(_ASCII_UNSAFE_TABLE).decode("ascii")
+        )
+    else:
+        sanitized = _UNSAFE_FILENAME_CHARS.sub("_", filename)
 
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(" .")
@@ -74,33 +98,62 @@ def sanitize_filename(filename: str) -> str:
 
 def get_unique_filename(directory: Path, filename: str) -> str:
     """Get a unique filename in the given directory."""
+    # List the directory once rather than stat-ing every candidate; names are
+    # casefolded so "Song.mp3" also blocks "song.mp3" on case-insensitive
+    # filesystems
+    try:
+        with os.scandir(directory) as entries:
+            existing = {entry.name.casefold() for entry in entries}
+    except OSError:
+        existing = set()
+
     stem = Path(filename).stem
     suffix = Path(filename).suffix
     counter = 1
     candidate = filename
 
-    while (directory / candidate).exists():
+    while candidate.casefold() in existing:
         candidate = f"{stem} ({counter}){suffix}"
         counter += 1
 
     return candidate
 
 
+@lru_cache(maxsize=64)
+def _is_plain_absolute(path: Path) -> bool:
+    """Return True if ``path`` is absolute and free of ``..``, once per path."""
+    return path.is_absolute() and ".." not in path.parts
+
+
+def _resolved(path: Path) -> Path:
+    """Return ``path`` expanded and absolute.
+
+    Paths that are already absolute and free of ``..`` are used as they are;
+    only the rest go through ``resolve()`` and its per-component stats. That
+    result depends on the working directory, so it is never memoized.
+    """
+    path = path.expanduser()
+    if _is_plain_absolute(path):
+        return path
+    return path.resolve()
+
+
 def open_folder(path: Path) -> bool:
     """Open the given folder in the system's file explorer."""
     try:
-        path = path.expanduser().resolve()
+        path = _resolved(path)
         if not path.exists():
             return False
 
-        system = platform.system()
+        system = _system()
 
         if system == "Darwin":
-            subprocess.run(["open", str(path)], check=False)
+            _launch(["open", str(path)])
         elif system == "Windows":
-            subprocess.run(["explorer", str(path)], check=False)
+            # Hand the folder to the shell directly; no child process needed
+            os.startfile(str(path))  # type: ignore[attr-defined]
         else:
-            subprocess.run(["xdg-open", str(path)], check=False)
+            _launch(["xdg-open", str(path)])
         return True
     except Exception:
         return False
@@ -109,18 +162,18 @@ def open_folder(path: Path) -> bool:
 def open_file(file_path: Path) -> bool:
     """Open the folder containing the file and select/highlight the file."""
     try:
-        file_path = file_path.expanduser().resolve()
+        file_path = _resolved(file_path)
         if not file_path.exists():
             return False
 
-        system = platform.system()
+        system = _system()
 
         if system == "Darwin":  # macOS
             # Use 'open -R' to reveal file in Finder
-            subprocess.run(["open", "-R", str(file_path)], check=False)
+            _launch(["open", "-R", str(file_path)])
         elif system == "Windows":
             # Use 'explorer /select,' to select file in Explorer
-            subprocess.run(["explorer", "/select,", str(file_path)], check=False)
+            _launch(["explorer", "/select,", str(file_path)])
         else:  # Linux and other Unix-like systems
             # xdg-open doesn't support selecting files, so open the containing folder
             # and try some alternative approaches
@@ -131,6 +184,25 @@ def open_file(file_path: Path) -> bool:
         return False
 
 
+def _launch(args: List[str]) -> None:
+    """Run a short-lived launcher command and wait for it to exit.
+
+    ``posix_spawnp`` skips the fork-based setup of ``subprocess`` where the
+    platform provides it; anything else goes through ``subprocess.run``.
+    """
+    if hasattr(os, "posix_spawnp"):
+        pid = os.posix_spawnp(args[0], args, os.environ)
+        os.waitpid(pid, 0)
+    else:
+        subprocess.run(args, check=False)
+
+
+@lru_cache(maxsize=None)
+def _find_executable(name: str) -> Optional[str]:
+    """Return the path of an executable on PATH, looked up once per name."""
+    return shutil.which(name)
+
+
 def _open_folder_with_file_selection_linux(folder_path: Path, file_path: Path) -> None:
     """Try to open folder and select file on Linux systems."""
     # Try different file managers that support selection
@@ -142,19 +214,14 @@ def _open_folder_with_file_selection_linux(folder_path: Path, file_path: Path) -
     ]
 
     for manager_cmd, args in file_managers:
+        # Check if the file manager is available without spawning `which`
+        if _find_executable(manager_cmd) is None:
+            continue
         try:
-            # Check if the file manager is available
-            result = subprocess.run(
-                ["which", manager_cmd],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                subprocess.run(args, check=False)
-                return
+            _launch(args)
+            return
         except Exception:
             continue
 
     # Fallback: just open the folder
-    subprocess.run(["xdg-open", str(folder_path)], check=False)
+    _launch(["xdg-open", str(folder_path)])
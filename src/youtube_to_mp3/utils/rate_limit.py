@@ -0,0 +1,92 @@
+"""Rate limiting shared by concurrent download workers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Space out requests to each host by a minimum interval.
+
+    Every caller reserves the next free slot for its host under a lock and
+    then sleeps outside it, so workers share one quota per host without
+    queueing behind each other, and different hosts never wait on one another.
+    ``intervals`` overrides ``min_interval`` for individual hosts; hosts whose
+    interval is zero pass straight through.
+    """
+
+    __slots__ = (
+        "min_interval", "intervals", "_clock", "_sleep", "_lock", "_next_slot"
+    )
+
+    def __init__(
+        self,
+        min_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        intervals: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.min_interval = min_interval
+        self.intervals = dict(intervals or {})
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to ``url``'s host may start; return the wait."""
+        host = urlparse(url).netloc.lower()
+        interval = self.intervals.get(host, self.min_interval)
+        if interval <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = start + interval
+
+        wait = start - now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrencyLimiter:
+    """Cap concurrent work with a limit that adapts to throttling (AIMD).
+
+    The limit starts at ``max_limit``. Each throttled attempt halves it (never
+    below one), and each other attempt raises it by ``1 / limit`` until it is
+    back at ``max_limit``. Work already running is never interrupted; a lower
+    limit takes effect as slots are released.
+    """
+
+    __slots__ = ("max_limit", "limit", "_active", "_condition")
+
+    def __init__(self, max_limit: int) -> None:
+        self.max_limit = max(1, max_limit)
+        self.limit = float(self.max_limit)
+        self._active = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until fewer than ``limit`` slots are in use, then take one."""
+        with self._condition:
+            while self._active >= int(self.limit):
+                self._condition.wait()
+            self._active += 1
+
+    def release(self, throttled: bool = False) -> None:
+        """Give a slot back and adjust the limit by how the attempt went."""
+        with self._condition:
+            self._active -= 1
+            if throttled:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+__all__ = ["AdaptiveConcurrencyLimiter", "HostRateLimiter"]
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
-import re
+import string
+from functools import lru_cache
 from typing import Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, unquote_plus, urlparse
+
+# Video IDs are exactly 11 of these; checked with a slice, not a regex
+_VIDEO_ID_LENGTH = 11
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_EMBED_PREFIX = "/embed/"
+
+# Every supported host contains this, so its absence rejects a URL unparsed
+_YOUTUBE_HOST_MARKER = "youtu"
 
 
 class URLValidator:
@@ -25,82 +34,110 @@ class URLValidator:
         return "https://" + url
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def is_valid_youtube_url(url: str) -> bool:
         """Check if a URL is a valid YouTube URL."""
         if not url or not isinstance(url, str):
             return False
 
         url = url.strip()
-        if not url:
+        if not url or _YOUTUBE_HOST_MARKER not in url.lower():
             return False
 
+        # Only the host decides validity, so skip the full classification
         try:
-            return URLValidator.classify_url(url)[0] != "invalid"
+            host = URLValidator._parse(url).netloc.lower()
         except Exception:
             return False
+        return URLValidator._is_youtube_host(host)
 
     @staticmethod
     def extract_video_id(url: str) -> Optional[str]:
         """Extract YouTube video ID from URL."""
-        normalized = URLValidator.normalize_url(url)
-        parsed = urlparse(normalized)
+        parsed = URLValidator._parse(url)
         host = parsed.netloc.lower()
-
-        if host == "youtu.be":
-            match = re.match(r"/([a-zA-Z0-9_-]{11})", parsed.path)
-            return match.group(1) if match else None
-
         if not URLValidator._is_youtube_host(host):
             return None
-
-        if parsed.path == "/watch":
-            query = dict(
-                part.split("=", 1)
-                for part in parsed.query.split("&")
-                if "=" in part
-            )
-            return query.get("v")
-
-        if parsed.path.startswith("/embed/"):
-            match = re.match(r"/embed/([a-zA-Z0-9_-]{11})", parsed.path)
-            return match.group(1) if match else None
-
-        return None
+        return URLValidator._video_id(parsed, host)
 
     @staticmethod
     def extract_playlist_id(url: str) -> Optional[str]:
         """Extract YouTube playlist ID from URL."""
-        normalized = URLValidator.normalize_url(url)
-        parsed = urlparse(normalized)
+        parsed = URLValidator._parse(url)
         if not URLValidator._is_youtube_host(parsed.netloc.lower()):
             return None
-        
-        # Parse query parameters safely
-        params = dict(
-            part.split("=", 1)
-            for part in parsed.query.split("&")
-            if "=" in part
-        )
-        return params.get("list")
+        return URLValidator._query_param(parsed, "list")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def classify_url(url: str) -> Tuple[str, Optional[str]]:
-        """Classify a YouTube URL as video, playlist, or invalid."""
-        normalized = URLValidator.normalize_url(url)
-        parsed = urlparse(normalized)
-        if not URLValidator._is_youtube_host(parsed.netloc.lower()):
+        """Classify a YouTube URL as video, playlist, or invalid.
+
+        Results are cached, so resubmitting the same URL costs a lookup.
+        """
+        if _YOUTUBE_HOST_MARKER not in url.lower():
+            return "invalid", None
+
+        # One parse and one host check; the ID lookups below reuse both
+        parsed = URLValidator._parse(url)
+        host = parsed.netloc.lower()
+        if not URLValidator._is_youtube_host(host):
             return "invalid", None
 
-        playlist_id = URLValidator.extract_playlist_id(url)
+        playlist_id = URLValidator._query_param(parsed, "list")
         if playlist_id:
             return "playlist", playlist_id
 
-        video_id = URLValidator.extract_video_id(url)
+        video_id = URLValidator._video_id(parsed, host)
         if video_id:
             return "video", video_id
 
         return "unknown", None
 
+    @staticmethod
+    def _parse(url: str) -> ParseResult:
+        """Parse a URL once for the extraction helpers."""
+        return urlparse(URLValidator.normalize_url(url))
+
+    @staticmethod
+    def _query_param(parsed: ParseResult, name: str) -> Optional[str]:
+        """Return the first value of one query parameter, decoded like parse_qs.
+
+        Scans for the wanted key and stops there, instead of building a dict
+        of every parameter; only values that need it are unquoted.
+        """
+        for part in parsed.query.split("&"):
+            key, separator, value = part.partition("=")
+            if separator and key == name:
+                if "%" in value or "+" in value:
+                    value = unquote_plus(value)
+                return value
+        return None
+
+    @staticmethod
+    def _video_id(parsed: ParseResult, host: str) -> Optional[str]:
+        """Return the video ID of a URL already known to be on a YouTube host."""
+        if host == "youtu.be":
+            if not parsed.path.startswith("/"):
+                return None
+            return URLValidator._id_at(parsed.path, 1)
+
+        if parsed.path == "/watch":
+            return URLValidator._query_param(parsed, "v")
+
+        if parsed.path.startswith(_EMBED_PREFIX):
+            return URLValidator._id_at(parsed.path, len(_EMBED_PREFIX))
+
+        return None
+
+    @staticmethod
+    def _id_at(path: str, start: int) -> Optional[str]:
+        """Return the 11-character video ID starting at ``start``, if any."""
+        video_id = path[start:start + _VIDEO_ID_LENGTH]
+        if len(video_id) == _VIDEO_ID_LENGTH and _VIDEO_ID_CHARS.issuperset(video_id):
+            return video_id
+        return None
+
     @staticmethod
     def _is_youtube_host(host: str) -> bool:
         """Return True for supported YouTube hostnames."""
@@ -0,0 +1,45 @@
+"""Reusable yt-dlp instances for worker threads."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List
+
+import yt_dlp
+
+
+class ThreadLocalYoutubeDL:
+    """Hand each thread its own long-lived ``YoutubeDL``.
+
+    Reusing an instance keeps its extractors warm (player code, cookies and
+    HTTP connections) across tracks, while per-thread instances avoid sharing
+    yt-dlp's mutable state between concurrent workers.
+    """
+
+    def __init__(self, params: Dict[str, Any]) -> None:
+        self._params = params
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instances: List[yt_dlp.YoutubeDL] = []
+
+    def get(self) -> yt_dlp.YoutubeDL:
+        """Return this thread's instance, creating it on first use."""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            # yt-dlp normalizes some params in place, so give it its own copy
+            ydl = yt_dlp.YoutubeDL(dict(self._params))
+            self._local.ydl = ydl
+            with self._lock:
+                self._instances.append(ydl)
+        return ydl
+
+    def close(self) -> None:
+        """Close every instance handed out so far."""
+        with self._lock:
+            instances, self._instances = self._instances, []
+        for ydl in instances:
+            ydl.close()
+        self._local = threading.local()
+
+
+__all__ = ["ThreadLocalYoutubeDL"]
@@ -0,0 +1,289 @@
+"""Tests for the album cover retriever."""
+
+from __future__ import annotations
+
+import json
+
+from youtube_to_mp3.album_cover_retriever import (
+    CoverResult,
+    ITunesRetriever,
+    MusicBrainzRetriever,
+    RateLimitedAdapter,
+    create_session,
+    lucene_quote,
+)
+from youtube_to_mp3.config import (
+    EXTENDED_SEARCH_LIMIT,
+    MUSICBRAINZ_HOST,
+    MUSICBRAINZ_REQUEST_INTERVAL,
+)
+from youtube_to_mp3.cover_cache import CoverCache
+from youtube_to_mp3.extractor import TrackMetadata
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests response."""
+
+    def __init__(self, payload: dict, status_code: int = 200) -> None:
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self.payload
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self.payload).encode("utf-8")
+
+
+class FakeSession:
+    """Session that records requests and replays a canned payload."""
+
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+        self.calls: list[tuple[str, dict]] = []
+
+    def get(self, url: str, params=None, **kwargs) -> FakeResponse:
+        self.calls.append((url, params or {}))
+        return FakeResponse(self.payload)
+
+
+def test_shared_session_rate_limits_musicbrainz():
+    session = create_session()
+    adapter = session.get_adapter("https://musicbrainz.org/ws/2/release")
+
+    assert isinstance(adapter, RateLimitedAdapter)
+    assert adapter.rate_limiter.intervals == {
+        MUSICBRAINZ_HOST: MUSICBRAINZ_REQUEST_INTERVAL
+    }
+    session.close()
+
+
+def test_search_recordings_batch_issues_single_query():
+    retriever = MusicBrainzRetriever()
+    retriever.session = FakeSession(
+        {
+            "recordings": [
+                {"title": "Song One", "releases": [{"id": "r1"}]},
+                {"title": "Song Two (Live)", "releases": [{"id": "r2"}]},
+            ]
+        }
+    )
+
+    matches = retriever.search_recordings_batch(
+        "Artist", ["Song One", "Song Two", "Song Three"]
+    )
+
+    assert len(retriever.session.calls) == 1
+    query = retriever.session.calls[0][1]["query"]
+    assert query.startswith('artist:"Artist" AND (')
+    assert '"Song Three"' in query
+    assert matches["Song One"][0]["releases"][0]["id"] == "r1"
+    assert matches["Song Two"][0]["releases"][0]["id"] == "r2"
+    assert "Song Three" not in matches
+
+
+def test_search_releases_batch_feeds_direct_album_search():
+    retriever = MusicBrainzRetriever()
+    retriever.session = FakeSession(
+        {
+            "releases": [
+                {"id": "r1", "title": "First Album"},
+                {"id": "r2", "title": "Second Album (Deluxe)"},
+                {"id": "r3", "title": "Unrelated"},
+            ]
+        }
+    )
+
+    matches = retriever.search_releases_batch(
+        "Artist", ["First Album", "Second Album", "Third Album"]
+    )
+
+    assert len(retriever.session.calls) == 1
+    query = retriever.session.calls[0][1]["query"]
+    assert query == (
+        'artist:"Artist" AND (release:"First Album" OR '
+        'release:"Second Album" OR release:"Third Album")'
+    )
+    assert [release["id"] for release in matches["First Album"]] == ["r1"]
+    assert [release["id"] for release in matches["Second Album"]] == ["r2"]
+    assert "Third Album" not in matches
+
+    # The direct search for a matched album is answered from the batch
+    releases = retriever._search_releases(
+        "Artist", "Second Album", limit=EXTENDED_SEARCH_LIMIT
+    )
+    assert [release["id"] for release in releases] == ["r2"]
+    assert len(retriever.session.calls) == 1
+
+
+def test_album_search_matches_one_page_exact_first():
+    retriever = MusicBrainzRetriever()
+    retriever.session = FakeSession(
+        {
+            "releases": [
+                {"id": "r1", "title": "Album Live"},
+                {"id": "r2", "title": "Album"},
+            ],
+            "images": [{"front": True, "image": "https://example.test/front.jpg"}],
+        }
+    )
+    metadata = TrackMetadata(title="Song", artist="Artist", album="Album")
+
+    result = retriever._search_album(metadata)
+
+    # The exact match wins over the earlier partial one, from a single search
+    assert result.release_info["id"] == "r2"
+    assert result.album_match_confidence == "exact"
+    assert [url for url, _ in retriever.session.calls] == [
+        f"{MusicBrainzRetriever.BASE_URL}/release",
+        f"{MusicBrainzRetriever.COVER_ART_URL}/release/r2",
+    ]
+
+
+def test_cover_art_prefers_shared_release_group():
+    retriever = MusicBrainzRetriever()
+    retriever.session = FakeSession(
+        {"images": [{"front": True, "image": "https://example.test/front.jpg"}]}
+    )
+    releases = [
+        {"id": "r1", "title": "Album", "release-group": {"id": "g1"}},
+        {"id": "r2", "title": "Album", "release-group": {"id": "g1"}},
+    ]
+
+    result = retriever._first_release_with_cover(
+        [(release, "exact") for release in releases]
+    )
+
+    assert result.cover_url == "https://example.test/front.jpg"
+    assert [url for url, _ in retriever.session.calls] == [
+        f"{MusicBrainzRetriever.COVER_ART_URL}/release-group/g1"
+    ]
+
+
+def test_cover_art_probing_stops_at_first_hit():
+    retriever = MusicBrainzRetriever()
+    retriever.session = FakeSession(
+        {"images": [{"front": True, "image": "https://example.test/front.jpg"}]}
+    )
+    candidates = [
+        ({"id": f"r{i}", "title": "Album"}, "exact") for i in range(3)
+    ]
+
+    result = retriever._first_release_with_cover(candidates)
+
+    assert result.release_info["id"] == "r0"
+    assert [url for url, _ in retriever.session.calls] == [
+        f"{MusicBrainzRetriever.COVER_ART_URL}/release/r0"
+    ]
+
+
+def test_itunes_artwork_url_requests_large_size():
+    retriever = ITunesRetriever()
+    base = "https://is1-ssl.mzstatic.com/image/thumb/Music/ab/cd"
+
+    assert retriever._get_best_cover_url(
+        {"artworkUrl100": f"{base}/100x100bb.jpg"}
+    ) == f"{base}/600x600bb.jpg"
+    assert retriever._get_best_cover_url(
+        {"artworkUrl60": f"{base}/60x60cc.jpg"}
+    ) == f"{base}/600x600bb.jpg"
+    assert retriever._get_best_cover_url({}) == ""
+
+
+def test_cover_cache_round_trip(tmp_path):
+    cache = CoverCache(tmp_path / "covers")
+    assert cache.get("Artist", "Album") is None
+
+    cache.set(
+        "Artist",
+        "Album Name (Deluxe)",
+        CoverResult(
+            success=True,
+            cover_url="https://example.test/cover.jpg",
+            cover_data=b"\xff\xd8image",
+            source="itunes",
+            album_match_confidence="exact",
+        ),
+    )
+
+    cached = cache.get("ARTIST", "album name")
+    assert cached is not None
+    assert cached.cover_data == b"\xff\xd8image"
+    assert cached.source == "itunes"
+
+    # Only the same normalized album is served, never a similar one
+    assert cache.get("Artist", "Album Name Vol. 2") is None
+    assert cache.get("Other Artist", "Album Name") is None
+    cache.close()
+
+
+def test_cover_cache_expires_entries_after_ttl(tmp_path):
+    cache = CoverCache(tmp_path / "covers", ttl=-1)
+    cache.set(
+        "Artist",
+        "Album",
+        CoverResult(
+            success=True,
+            cover_url="https://example.test/cover.jpg",
+            cover_data=b"data",
+        ),
+    )
+    assert cache.get("Artist", "Album") is None
+    cache.close()
+
+
+def test_cover_cache_prunes_expired_rows_and_images(tmp_path):
+    cache = CoverCache(tmp_path / "covers")
+    cache.set(
+        "Artist",
+        "Album",
+        CoverResult(
+            success=True,
+            cover_url="https://example.test/cover.jpg",
+            cover_data=b"data",
+        ),
+    )
+    cache.close()
+    assert list((tmp_path / "covers" / "images").iterdir())
+
+    # Reopening with everything expired deletes the row and its image
+    expired = CoverCache(tmp_path / "covers", ttl=-1)
+    assert expired.get("Artist", "Album") is None
+    assert not list((tmp_path / "covers" / "images").iterdir())
+    expired.close()
+
+
+def test_cover_cache_ignores_failures(tmp_path):
+    cache = CoverCache(tmp_path / "covers")
+    cache.set("Artist", "Album", CoverResult(success=False, error="miss"))
+    assert cache.get("Artist", "Album") is None
+    cache.close()
+
+
+def test_cover_cache_remembers_misses_until_found(tmp_path):
+    cache = CoverCache(tmp_path / "covers")
+    assert not cache.is_known_album_miss("Artist", "Album")
+
+    cache.record_album_miss("Artist", "Album")
+    assert cache.is_known_album_miss("artist", "ALBUM")
+
+    cache.set(
+        "Artist",
+        "Album",
+        CoverResult(
+            success=True,
+            cover_url="https://example.test/cover.jpg",
+            cover_data=b"data",
+        ),
+    )
+    assert not cache.is_known_album_miss("Artist", "Album")
+    cache.close()
+
+
+def test_lucene_quote_escapes_query_syntax():
+    assert lucene_quote("Plain") == '"Plain"'
+    assert lucene_quote('AC/DC: "Live"') == '"AC\\/DC\\: \\"Live\\""'
@@ -0,0 +1,67 @@
+"""Tests for configuration loading."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from youtube_to_mp3.config import load_config
+
+
+def test_load_config_reloads_after_file_changes(tmp_path: Path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"audio_quality": "256"}), encoding="utf-8")
+
+    assert load_config(explicit_path=config_path).audio_quality == "256"
+    # Overrides apply to the returned config, never to the memoized file data
+    overridden = load_config(
+        explicit_path=config_path, overrides={"audio_quality": "128"}
+    )
+    assert overridden.audio_quality == "128"
+    assert load_config(explicit_path=config_path).audio_quality == "256"
+
+    config_path.write_text(json.dumps({"audio_quality": "320"}), encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_config(explicit_path=config_path).audio_quality == "320"
+
+
+def test_output_directory_expands_home_only_when_referenced(tmp_path: Path):
+    config = load_config(
+        explicit_path=tmp_path / "missing.json",
+        overrides={"output_directory": "~/Music"},
+    )
+    assert config.output_directory == Path.home() / "Music"
+
+    config.merge_overrides({"output_directory": str(tmp_path / "out")})
+    assert config.output_directory == tmp_path / "out"
+
+
+def test_cover_cache_settings_load_from_file_and_overrides(tmp_path: Path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"cover_cache_directory": str(tmp_path / "covers")}),
+        encoding="utf-8",
+    )
+
+    config = load_config(explicit_path=config_path)
+    assert config.cover_cache_enabled
+    assert config.cover_cache_directory == tmp_path / "covers"
+
+    config.merge_overrides({"cover_cache_enabled": False})
+    assert not config.cover_cache_enabled
+
+
+def test_skip_tagged_watch_pages_is_opt_in(tmp_path: Path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({}), encoding="utf-8")
+    assert not load_config(explicit_path=config_path).skip_tagged_watch_pages
+
+    config_path.write_text(
+        json.dumps({"skip_tagged_watch_pages": True}), encoding="utf-8"
+    )
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_config(explicit_path=config_path).skip_tagged_watch_pages
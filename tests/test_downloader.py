@@ -0,0 +1,74 @@
+"""Tests for the audio downloader."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from youtube_to_mp3.downloader import AudioDownloader
+from youtube_to_mp3.extractor import TrackMetadata
+
+
+def test_text_tags_are_written_during_conversion(tmp_path: Path):
+    downloader = AudioDownloader()
+    metadata = TrackMetadata(
+        title="Song",
+        artist="Artist",
+        album="Album",
+        year=2020,
+        track_number=2,
+        total_tracks=9,
+    )
+
+    opts = downloader._get_ydl_opts(tmp_path / "song.mp3", metadata)
+
+    assert opts["postprocessor_args"]["extractaudio+ffmpeg_o"] == [
+        "-metadata", "title=Song",
+        "-metadata", "artist=Artist",
+        "-metadata", "album=Album",
+        "-metadata", "date=2020",
+        "-metadata", "track=2/9",
+    ]
+    downloader.close()
+
+
+def test_format_prefers_mp3_stream_at_target_bitrate():
+    downloader = AudioDownloader(audio_quality="192")
+    assert downloader._get_ydl_opts(Path("song.mp3"))["format"] == (
+        "bestaudio[acodec=mp3][abr>=192]/bestaudio/best"
+    )
+    downloader.close()
+
+    # VBR quality levels have no bitrate to compare against
+    downloader = AudioDownloader(audio_quality="0")
+    assert downloader._get_ydl_opts(Path("song.mp3"))["format"] == "bestaudio/best"
+    downloader.close()
+
+
+def test_prepare_output_paths_renders_template_fields(tmp_path: Path):
+    downloader = AudioDownloader(filename_template="{track_number} {title} {missing}")
+    tracks = [
+        TrackMetadata(title="Intro", artist="Artist", track_number=1),
+        TrackMetadata(title="What?", artist="Artist"),
+    ]
+
+    assert downloader.prepare_output_paths(tracks, tmp_path) == [
+        tmp_path / "1 Intro.mp3",
+        tmp_path / "What_.mp3",
+    ]
+    assert downloader.create_output_path(tracks[0], tmp_path) == (
+        tmp_path / "1 Intro.mp3"
+    )
+    downloader.close()
+
+
+def test_guess_mime_type_from_signature():
+    downloader = AudioDownloader()
+    padding = b"\x00" * 16
+
+    assert downloader._guess_mime_type(b"\xff\xd8\xff" + padding) == "image/jpeg"
+    assert downloader._guess_mime_type(b"\x89PNG\r\n\x1a\n" + padding) == "image/png"
+    assert downloader._guess_mime_type(b"GIF89a" + padding) == "image/gif"
+    assert downloader._guess_mime_type(b"RIFF\x10\x00\x00\x00WEBPVP8 ") == "image/webp"
+    # Other RIFF payloads (e.g. WAVE) fall back to the default
+    assert downloader._guess_mime_type(b"RIFF\x10\x00\x00\x00WAVEfmt ") == "image/jpeg"
+    downloader.close()
@@ -1,7 +1,14 @@
 """Tests for the YouTube extractor module."""
 
 import pytest
-from youtube_to_mp3.extractor import YouTubeExtractor, TrackMetadata, PlaylistInfo
+from youtube_to_mp3 import extractor as extractor_module
+from youtube_to_mp3.extractor import (
+    YouTubeExtractor,
+    TrackMetadata,
+    PlaylistInfo,
+    _parse_engagement_panels,
+    _parse_initial_data,
+)
 
 
 class TestYouTubeExtractor:
@@ -57,6 +64,136 @@ class TestYouTubeExtractor:
             video_id = extractor._extract_video_id(url)
             assert video_id == expected_id
 
+    def test_playlist_entries_keep_order_when_resolved_in_parallel(self, monkeypatch):
+        """Playlist entries are resolved concurrently but stay in playlist order."""
+        extractor = YouTubeExtractor(max_workers=3)
+        monkeypatch.setattr(extractor, "_get_structured_metadata", lambda url: None)
+
+        info = {
+            "title": "Mixed Playlist",
+            "entries": [
+                {"title": f"Artist - Song {i}", "webpage_url": f"https://youtu.be/{i}"}
+                for i in range(1, 6)
+            ],
+        }
+        playlist = extractor._extract_playlist_info(info)
+
+        assert [track.title for track in playlist.tracks] == [
+            f"Song {i}" for i in range(1, 6)
+        ]
+        assert [track.track_number for track in playlist.tracks] == [1, 2, 3, 4, 5]
+        assert playlist.total_tracks == 5
+
+    def test_structured_metadata_is_cached_by_video_id(self, extractor, monkeypatch):
+        """Repeated lookups of one video fetch its page only once."""
+        statuses = [503, 200]
+        calls = []
+
+        class Response:
+            def __init__(self, status_code):
+                self.status_code = status_code
+                self.content = b"var ytInitialData = {};</script>"
+
+        def fake_get(url, timeout=None):
+            calls.append(url)
+            return Response(statuses.pop(0))
+
+        monkeypatch.setattr(extractor.session, "get", fake_get)
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        # A failed fetch is retried, a successful one is served from the cache
+        assert extractor._get_structured_metadata(url) is None
+        assert extractor._get_structured_metadata(url) is None
+        assert extractor._get_structured_metadata("https://youtu.be/dQw4w9WgXcQ") is None
+        assert len(calls) == 2
+
+    def test_structured_metadata_cache_is_bounded(self, extractor, monkeypatch):
+        """Only the most recently used videos stay cached."""
+        calls = []
+
+        class Response:
+            status_code = 200
+            content = b"var ytInitialData = {};</script>"
+
+        def fake_get(url, timeout=None):
+            calls.append(url)
+            return Response()
+
+        monkeypatch.setattr(extractor.session, "get", fake_get)
+        monkeypatch.setattr(extractor_module, "STRUCTURED_CACHE_SIZE", 1)
+        first = "https://youtu.be/dQw4w9WgXcQ"
+        second = "https://youtu.be/9bZkp7q19f0"
+
+        extractor._get_structured_metadata(first)
+        extractor._get_structured_metadata(second)
+        # The first video was evicted by the second, so it is fetched again
+        extractor._get_structured_metadata(first)
+        assert calls == [first, second, first]
+
+    def test_structured_lookup_skipped_only_when_opted_in(self, extractor, monkeypatch):
+        """The page fetch is kept by default because it supplies the YouTube cover."""
+        info = {
+            "title": "Artist - Song (Official Video)",
+            "webpage_url": "https://youtu.be/dQw4w9WgXcQ",
+            "track": "Song",
+            "artist": "Artist",
+            "album": "Album",
+        }
+        card = {"album_cover_url": "https://yt.test/cover.jpg"}
+        monkeypatch.setattr(extractor, "_get_structured_metadata", lambda url: card)
+
+        metadata = extractor._extract_track_metadata(info)
+        assert metadata.youtube_album_cover_url == "https://yt.test/cover.jpg"
+
+        lookups = []
+        skipping = YouTubeExtractor(skip_tagged_watch_pages=True)
+        monkeypatch.setattr(
+            skipping, "_get_structured_metadata", lambda url: lookups.append(url)
+        )
+
+        metadata = skipping._extract_track_metadata(info)
+
+        assert lookups == []
+        assert (metadata.title, metadata.artist, metadata.album) == ("Song", "Artist", "Album")
+
+    def test_parse_initial_data_stops_at_object_end(self):
+        """Test ytInitialData decoding with braces inside strings."""
+        page = (
+            b'<script>var ytInitialData = {"a": {"text": "x};y"}, "b": [1]};'
+            b'</script><script>var other = {"c": 2};</script>'
+        )
+
+        assert _parse_initial_data(page) == {"a": {"text": "x};y"}, "b": [1]}
+        # Without the closing script tag the stdlib decoder finds the object end
+        unterminated = page.split(b"</script>")[0]
+        assert _parse_initial_data(unterminated) == {"a": {"text": "x};y"}, "b": [1]}
+        assert _parse_initial_data(b"<html></html>") is None
+
+    def test_parse_engagement_panels_decodes_only_the_panels(self):
+        """Test reading the panels list without the rest of ytInitialData."""
+        page = (
+            b'<script>var ytInitialData = {"contents": {"x": "["}, '
+            b'"engagementPanels": [{"id": 1}], "topbar": {}};</script>'
+        )
+
+        assert _parse_engagement_panels(page) == [{"id": 1}]
+        assert _parse_engagement_panels(b'var ytInitialData = {"a": 1};</script>') == []
+
+    def test_parse_engagement_panels_ignores_nested_keys(self):
+        """Test that only the top-level panels list is returned."""
+        nested_after = (
+            b'<script>var ytInitialData = {"engagementPanels": [{"id": 1}], '
+            b'"frameworkUpdates": {"engagementPanels": [{"id": 2}]}};</script>'
+        )
+        nested_only = (
+            b'<script>var ytInitialData = {"contents": '
+            b'{"engagementPanels": [{"id": 2}]}};</script>'
+        )
+
+        assert _parse_engagement_panels(nested_after) == [{"id": 1}]
+        assert _parse_engagement_panels(nested_only) == []
+        assert _parse_engagement_panels(b"<html></html>") is None
+
 
 class TestTrackMetadata:
     """Test the TrackMetadata dataclass."""
@@ -1,8 +1,9 @@
 """Tests for metadata and validation helpers."""
 
-from youtube_to_mp3.album_cover_retriever import AlbumMatcher
+from youtube_to_mp3.album_cover_retriever import AlbumMatcher, NormalizedAlbum
 from youtube_to_mp3.extractor import TrackMetadata
 from youtube_to_mp3.metadata import MetadataCleaner, MetadataFormatter
+from youtube_to_mp3.utils.filesystem import get_unique_filename
 from youtube_to_mp3.utils.validation import URLValidator
 
 
@@ -28,6 +29,11 @@ def test_metadata_cleaner_applies_defaults():
     assert cleaned.year is None
     assert cleaned.track_number is None
     assert cleaned.total_tracks == 2
+    # Untouched fields are carried over
+    assert cleaned.duration == 185
+    assert cleaned.source_url == "https://example.test"
+    assert cleaned.extra == raw.extra
+    assert cleaned.extra is not raw.extra
 
 
 def test_metadata_formatter_duration():
@@ -38,6 +44,13 @@ def test_metadata_formatter_duration():
     assert formatted["Duration"] == "04:05"
 
 
+def test_get_unique_filename_ignores_case(tmp_path):
+    (tmp_path / "Song.mp3").write_bytes(b"")
+
+    assert get_unique_filename(tmp_path, "song.mp3") == "song (1).mp3"
+    assert get_unique_filename(tmp_path, "Other.mp3") == "Other.mp3"
+
+
 def test_url_validator_classifies_urls():
     video_url = "https://youtu.be/dQw4w9WgXcQ"
     playlist_url = "https://www.youtube.com/playlist?list=PL12345"
@@ -57,6 +70,26 @@ def test_url_validator_classifies_urls():
     assert URLValidator.classify_url(invalid_url)[0] == "invalid"
 
 
+def test_url_validator_extracts_ids_on_any_youtube_host():
+    video_id = "dQw4w9WgXcQ"
+
+    assert URLValidator.extract_video_id(
+        f"https://music.youtube.com/watch?v={video_id}&feature=share"
+    ) == video_id
+    embed_url = f"www.youtube.com/embed/{video_id}"
+    assert URLValidator.extract_video_id(embed_url) == video_id
+    other_url = f"https://example.com/watch?v={video_id}"
+    assert URLValidator.extract_video_id(other_url) is None
+    assert URLValidator.classify_url(
+        "https://music.youtube.com/playlist?list=OLAK5uy_x"
+    ) == ("playlist", "OLAK5uy_x")
+    assert not URLValidator.is_valid_youtube_url("https://notyoutube.com/watch?v=x")
+    # Query values are percent-decoded like parse_qs would
+    assert URLValidator.extract_playlist_id(
+        "https://www.youtube.com/playlist?feature=share&list=PL%2Dabc"
+    ) == "PL-abc"
+
+
 def test_album_matcher_normalize_album_name():
     """Test album name normalization."""
     # Test basic normalization
@@ -89,3 +122,18 @@ def test_album_matcher_album_names_match():
 
     # No album expected
     assert AlbumMatcher.album_names_match("Any Name", "") == (True, "no_album_expected")
+
+
+def test_album_matcher_accepts_normalized_album():
+    """Precomputed expected albums match exactly like raw strings."""
+    expected = NormalizedAlbum.from_name("Album Name (Deluxe)")
+
+    assert expected.norm == "album name"
+    assert expected.words == frozenset({"album", "name"})
+    assert AlbumMatcher.album_names_match("Album Name", expected) == (True, "exact")
+    assert AlbumMatcher.album_names_match("Album Two Name", expected) == (True, "word_overlap")
+    assert AlbumMatcher.album_names_match("EP", expected) == (False, "no_match")
+    assert AlbumMatcher.album_names_match("Any", NormalizedAlbum.from_name("")) == (
+        True,
+        "no_album_expected",
+    )
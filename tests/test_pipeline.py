@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from pathlib import Path
 
 import pytest
@@ -19,8 +20,10 @@ class StubExtractor:
 
     def __init__(self, playlist: bool = False) -> None:
         self.playlist = playlist
+        self.calls: list[str] = []
 
     def extract_metadata(self, url: str):  # noqa: D401 - part of stub interface
+        self.calls.append(url)
         if self.playlist:
             tracks = [
                 TrackMetadata(title="Song 1", artist="Artist", source_url=f"{url}/1"),
@@ -45,6 +48,9 @@ class FakeDownloader:
     def create_output_path(self, metadata: TrackMetadata, base_dir: Path) -> Path:
         return base_dir / f"{metadata.title}.mp3"
 
+    def prepare_output_paths(self, tracks, base_dir: Path) -> list[Path]:
+        return [self.create_output_path(metadata, base_dir) for metadata in tracks]
+
     def download_track(self, job: DownloadJob) -> DownloadResult:
         job.status = "completed"
         job.error = None
@@ -79,6 +85,27 @@ def test_pipeline_downloads_tracks(tmp_path: Path):
     assert progress_events == [(1, "in_progress"), (1, "completed")]
 
 
+def test_pipeline_reuses_recent_extractions(tmp_path: Path):
+    config = AppConfig(output_directory=tmp_path)
+    extractor = StubExtractor(playlist=True)
+    pipeline = DownloadPipeline(config, extractor=extractor, downloader=FakeDownloader())  # type: ignore[arg-type]
+
+    first = pipeline.extract("https://youtube.com/playlist?list=PL1")
+    first.tracks[0].title = "Edited"
+    second = pipeline.extract("https://youtube.com/playlist?list=PL1")
+
+    assert extractor.calls == ["https://youtube.com/playlist?list=PL1"]
+    # Edits to a previous result do not leak into the cached metadata
+    assert second.tracks[0].title == "Song 1"
+
+
+def test_pipeline_passes_watch_page_skip_to_extractor(tmp_path: Path):
+    config = AppConfig(output_directory=tmp_path, skip_tagged_watch_pages=True)
+    pipeline = DownloadPipeline(config, downloader=FakeDownloader())  # type: ignore[arg-type]
+
+    assert pipeline.extractor.skip_tagged_watch_pages
+
+
 def test_pipeline_validates_missing_source_url(tmp_path: Path):
     config = AppConfig(output_directory=tmp_path)
     extractor = StubExtractor()
@@ -91,6 +118,26 @@ def test_pipeline_validates_missing_source_url(tmp_path: Path):
         pipeline.create_download_jobs(extraction.tracks, tmp_path)
 
 
+def test_create_download_jobs_avoids_existing_and_duplicate_names(tmp_path: Path):
+    config = AppConfig(output_directory=tmp_path)
+    pipeline = DownloadPipeline(config, extractor=StubExtractor(), downloader=FakeDownloader())  # type: ignore[arg-type]
+    (tmp_path / "Song.mp3").write_bytes(b"")
+
+    tracks = [
+        TrackMetadata(title=title, artist="Artist", source_url=f"u{i}")
+        for i, title in enumerate(["Song", "song", "Other", "Song", "Other"])
+    ]
+    jobs = pipeline.create_download_jobs(tracks, tmp_path)
+
+    assert [job.output_path.name for job in jobs] == [
+        "Song (1).mp3",
+        "song (2).mp3",
+        "Other.mp3",
+        "Song (3).mp3",
+        "Other (1).mp3",
+    ]
+
+
 def test_album_cover_cache():
     """Test album cover cache functionality."""
     cache = AlbumCoverCache()
@@ -111,6 +158,9 @@ def test_album_cover_cache():
     # Test case insensitive matching
     cached_result_upper = cache.get_cover("ARTIST", "ALBUM")
     assert cached_result_upper is not None
+    assert cache.get_cover(" Artist", "Album ") is cached_result
+    # Full-width and other compatibility forms share the entry
+    assert cache.get_cover("Ａｒｔｉｓｔ", "ALBUM") is cached_result
 
     # Test different artist/album returns None
     different_result = cache.get_cover("Different Artist", "Album")
@@ -120,3 +170,221 @@ def test_album_cover_cache():
     cache.clear()
     cleared_result = cache.get_cover("Artist", "Album")
     assert cleared_result is None
+
+
+def test_album_cover_cache_evicts_least_recently_used():
+    cache = AlbumCoverCache(maxsize=2)
+    first = CoverResult(success=True, cover_url="http://example.com/1.jpg")
+    cache.set_cover("Artist", "One", first)
+    cache.set_cover("Artist", "Two", CoverResult(success=True))
+
+    # Reading "One" makes "Two" the oldest entry, so it goes first
+    assert cache.get_cover("Artist", "One") is first
+    cache.set_cover("Artist", "Three", CoverResult(success=True))
+
+    assert cache.get_cover("Artist", "Two") is None
+    assert cache.get_cover("Artist", "One") is first
+    assert cache.get_cover("Artist", "Three") is not None
+
+
+def test_album_cover_cache_expires_entries():
+    now = [0.0]
+    cache = AlbumCoverCache(ttl=60, clock=lambda: now[0])
+    cache.set_cover("Artist", "Album", CoverResult(success=True))
+
+    now[0] = 59.0
+    assert cache.get_cover("Artist", "Album") is not None
+    now[0] = 60.0
+    assert cache.get_cover("Artist", "Album") is None
+    # An expired album can be claimed for a fresh lookup
+    assert cache.claim_pending([AlbumCoverCache.make_key("Artist", "Album")])
+    cache.release_pending()
+
+
+def test_album_cover_cache_forgets_misses_sooner():
+    now = [0.0]
+    cache = AlbumCoverCache(ttl=60, negative_ttl=10, clock=lambda: now[0])
+    cache.set_cover("Artist", "Album", CoverResult(success=False))
+
+    assert cache.get_cover("Artist", "Album").success is False
+    now[0] = 10.0
+    assert cache.get_cover("Artist", "Album") is None
+
+
+def test_album_cover_cache_shares_cover_bytes():
+    cache = AlbumCoverCache()
+    cover_data = b"\xff\xd8" + b"\x00" * 1024
+    cache.set_cover("Artist", "Album", CoverResult(success=True, cover_data=cover_data))
+
+    # Every track of the album embeds the same buffer instead of a copy
+    first = cache.get_cover("Artist", "Album")
+    second = cache.get_cover("artist", "album")
+    assert id(first.cover_data) == id(second.cover_data) == id(cover_data)
+
+
+def test_album_cover_cache_claims_only_idle_albums():
+    cache = AlbumCoverCache()
+    cache.set_cover("Cached", "Album", CoverResult(success=True))
+    keys = [
+        AlbumCoverCache.make_key("Cached", "Album"),
+        AlbumCoverCache.make_key("New", "Album"),
+        AlbumCoverCache.make_key("NEW", "album"),
+    ]
+
+    assert cache.claim_pending(keys) == [("new", "album")]
+    assert cache.has_cover("New", "Album")
+    # A second claim finds the album already in flight
+    assert cache.claim_pending(keys) == []
+    cache.release_pending()
+
+
+def test_album_cover_cache_releases_only_the_claimed_albums():
+    cache = AlbumCoverCache()
+    first = cache.claim_pending([AlbumCoverCache.make_key("First", "Album")])
+    second = cache.claim_pending([AlbumCoverCache.make_key("Second", "Album")])
+
+    # Finishing one batch leaves the other batch's lookup in flight
+    cache.release_pending(first)
+    assert not cache.has_cover("First", "Album")
+    assert cache.has_cover("Second", "Album")
+    cache.release_pending(second)
+    assert not cache.has_cover("Second", "Album")
+
+
+def test_album_cover_cache_computes_once_for_concurrent_callers():
+    cache = AlbumCoverCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def factory() -> CoverResult:
+        calls.append(threading.get_ident())
+        started.set()
+        release.wait(timeout=5)
+        return CoverResult(success=True, cover_url="http://example.com/c.jpg")
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.get_or_compute("Artist", "Album", factory)
+            )
+        )
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+
+
+class FakeCoverRetriever:
+    """Cover retriever that answers instantly and counts lookups."""
+
+    def __init__(self) -> None:
+        self.lookups: list[tuple[str, str]] = []
+        self.titles: list[str] = []
+
+    def retrieve_covers(self, metadatas, on_result=None):
+        results = []
+        for index, metadata in enumerate(metadatas):
+            self.lookups.append((metadata.artist, metadata.album))
+            self.titles.append(metadata.title)
+            result = CoverResult(success=True, source="fake")
+            results.append(result)
+            if on_result:
+                on_result(index, result)
+        return results
+
+
+class CoverAwareDownloader(FakeDownloader):
+    """Downloader that reads covers from the shared cache like the real one."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cover_retriever = FakeCoverRetriever()
+
+    def download_track_with_cache(self, job: DownloadJob, cover_cache=None) -> DownloadResult:
+        result = self.download_track(job)
+        result.cover_result = cover_cache.get_cover(
+            job.metadata.artist, job.metadata.album
+        )
+        return result
+
+
+def test_pipeline_pre_caches_each_album_once(tmp_path: Path):
+    config = AppConfig(output_directory=tmp_path)
+    downloader = CoverAwareDownloader()
+    pipeline = DownloadPipeline(config, extractor=StubExtractor(), downloader=downloader)  # type: ignore[arg-type]
+
+    tracks = [
+        TrackMetadata(
+            title=f"Song {i}", artist="Artist", album="Album", source_url=f"u{i}"
+        )
+        for i in range(3)
+    ]
+    jobs = pipeline.create_download_jobs(tracks, tmp_path)
+    outcomes = asyncio.run(pipeline.download(jobs))
+
+    assert downloader.cover_retriever.lookups == [("Artist", "Album")]
+    # The album is looked up through its first real track
+    assert downloader.cover_retriever.titles == ["Song 0"]
+    assert all(outcome.cover_success for outcome in outcomes)
+
+
+class BarrierDownloader(FakeDownloader):
+    """Downloader whose jobs only finish once two of them run at the same time."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def download_track_with_cache(self, job: DownloadJob, cover_cache=None) -> DownloadResult:
+        self.barrier.wait()
+        return self.download_track(job)
+
+
+def test_pipeline_runs_downloads_concurrently_in_job_order(tmp_path: Path):
+    config = AppConfig(output_directory=tmp_path, download_workers=2)
+    downloader = BarrierDownloader()
+    pipeline = DownloadPipeline(config, extractor=StubExtractor(), downloader=downloader)  # type: ignore[arg-type]
+
+    tracks = [
+        TrackMetadata(title=f"Song {i}", artist="Artist", source_url=f"u{i}")
+        for i in range(4)
+    ]
+    jobs = pipeline.create_download_jobs(tracks, tmp_path)
+    outcomes = asyncio.run(pipeline.download(jobs))
+
+    assert [outcome.job for outcome in outcomes] == jobs
+    assert all(outcome.success for outcome in outcomes)
+
+
+class ThrottledDownloader(FakeDownloader):
+    """Downloader that YouTube answers with HTTP 429 every time."""
+
+    def download_track_with_cache(self, job: DownloadJob, cover_cache=None) -> DownloadResult:
+        job.status = "error"
+        job.error = "ERROR: unable to download video data: HTTP Error 429: Too Many Requests"
+        return DownloadResult(success=False, error=job.error)
+
+
+def test_pipeline_lowers_concurrency_when_throttled(tmp_path: Path):
+    config = AppConfig(output_directory=tmp_path, download_workers=4)
+    pipeline = DownloadPipeline(config, extractor=StubExtractor(), downloader=ThrottledDownloader())  # type: ignore[arg-type]
+
+    tracks = [
+        TrackMetadata(title=f"Song {i}", artist="Artist", source_url=f"u{i}")
+        for i in range(2)
+    ]
+    outcomes = asyncio.run(pipeline.download(pipeline.create_download_jobs(tracks, tmp_path)))
+
+    assert not any(outcome.success for outcome in outcomes)
+    assert pipeline.concurrency.limit == 1
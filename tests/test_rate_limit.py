@@ -0,0 +1,64 @@
+"""Tests for the per-host rate limiter."""
+
+from __future__ import annotations
+
+from youtube_to_mp3.utils.rate_limit import AdaptiveConcurrencyLimiter, HostRateLimiter
+
+
+class FakeClock:
+    """Clock that only advances when the limiter sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    clock = FakeClock()
+    limiter = HostRateLimiter(1.5, clock=clock.time, sleep=clock.sleep)
+
+    assert limiter.acquire("https://www.youtube.com/watch?v=a") == 0
+    assert limiter.acquire("https://www.youtube.com/watch?v=b") == 1.5
+    # Another host has its own quota and does not wait
+    assert limiter.acquire("https://music.example.com/track") == 0
+    assert clock.sleeps == [1.5]
+
+
+def test_rate_limiter_applies_per_host_intervals():
+    clock = FakeClock()
+    limiter = HostRateLimiter(
+        0.0, clock=clock.time, sleep=clock.sleep, intervals={"musicbrainz.org": 1.0}
+    )
+
+    assert limiter.acquire("https://musicbrainz.org/ws/2/release") == 0
+    assert limiter.acquire("https://musicbrainz.org/ws/2/recording") == 1.0
+    # Hosts without an interval are never held back
+    assert limiter.acquire("https://coverartarchive.org/release/x") == 0
+    assert limiter.acquire("https://coverartarchive.org/release/y") == 0
+    assert clock.sleeps == [1.0]
+
+
+def test_concurrency_limiter_halves_on_throttling_and_recovers():
+    limiter = AdaptiveConcurrencyLimiter(4)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+    limiter.acquire()
+    limiter.release(throttled=True)
+    limiter.acquire()
+    limiter.release(throttled=True)
+    # Never drops below a single slot
+    assert limiter.limit == 1
+
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 4